@@ -1,6 +1,8 @@
 """LLM 클라이언트 - 다양한 AI 모델 지원"""
 
+import hashlib
 import re
+import threading
 from typing import AsyncGenerator, Optional
 from abc import ABC, abstractmethod
 
@@ -42,10 +44,36 @@ def _sort_models_by_newest(models: list[str]) -> list[str]:
     return sorted(models, key=_extract_version, reverse=True)
 
 
+# 검증용 SDK 클라이언트를 프로바이더별로 하나씩 재사용해 HTTP 연결 풀(keep-alive)을 유지
+# 키 원문을 캐시 키로 두지 않도록 키 해시가 바뀌면 클라이언트를 새로 만듦
+# 재시도는 SDK 기본 동작(max_retries)에 맡김
+_sdk_clients: dict[str, tuple[str, object]] = {}
+_sdk_clients_lock = threading.Lock()
+
+
+def _get_sdk_client(provider: str, api_key: str, factory):
+    """프로바이더별 SDK 클라이언트 반환 (키가 바뀐 경우에만 재생성)"""
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    with _sdk_clients_lock:
+        entry = _sdk_clients.get(provider)
+        if entry is None or entry[0] != key_hash:
+            entry = (key_hash, factory(api_key=api_key))
+            _sdk_clients[provider] = entry
+        return entry[1]
+
+
+def _get_openai_client(api_key: str) -> OpenAI:
+    return _get_sdk_client("openai", api_key, OpenAI)
+
+
+def _get_anthropic_client(api_key: str) -> Anthropic:
+    return _get_sdk_client("anthropic", api_key, Anthropic)
+
+
 def fetch_openai_models(api_key: str) -> tuple[bool, str, list[str]]:
     """OpenAI API에서 사용 가능한 모델 목록 가져오기"""
     try:
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         models = client.models.list()
 
         # GPT-5.2만 필터링
@@ -86,7 +114,7 @@ def fetch_anthropic_models(api_key: str) -> tuple[bool, str, list[str]]:
     ]
 
     try:
-        client = Anthropic(api_key=api_key)
+        client = _get_anthropic_client(api_key)
 
         # 키 검증을 위해 간단한 요청
         available_models = []
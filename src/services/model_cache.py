@@ -0,0 +1,105 @@
+"""검증된 모델 목록 디스크 캐시
+
+API 키 검증으로 받은 모델 목록을 SQLite에 보관해, 다이얼로그를 다시 열거나
+앱을 재시작해도 같은 키는 네트워크 요청 없이 모델 목록을 표시할 수 있게 합니다.
+API 키는 저장하지 않고 SHA-256 해시만 키로 사용합니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+from src.config import get_cache_dir
+
+logger = structlog.get_logger(__name__)
+
+# 캐시 유효 시간 (초)
+MODEL_CACHE_TTL = 6 * 60 * 60
+
+_CACHE_FILE_NAME = "models_cache.sqlite"
+
+_lock = threading.Lock()
+_db_path: Optional[Path] = None
+
+
+def _key_hash(provider: str, api_key: str) -> str:
+    """프로바이더와 API 키로 캐시 키 생성"""
+    return hashlib.sha256(f"{provider}:{api_key}".encode("utf-8")).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    """캐시 DB 연결 (처음 호출 시 테이블 생성)"""
+    global _db_path
+    if _db_path is None:
+        path = get_cache_dir() / _CACHE_FILE_NAME
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS models ("
+            "provider TEXT NOT NULL, key_hash TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, models TEXT NOT NULL, "
+            "PRIMARY KEY (provider, key_hash))"
+        )
+        conn.commit()
+        _db_path = path
+        return conn
+    return sqlite3.connect(_db_path)
+
+
+def get_models(provider: str, api_key: str, ttl: float = MODEL_CACHE_TTL) -> Optional[list[str]]:
+    """캐시된 모델 목록 조회
+
+    Args:
+        provider: 프로바이더 이름 (openai, anthropic)
+        api_key: API 키
+        ttl: 유효 시간 (초)
+
+    Returns:
+        유효한 캐시가 있으면 모델 목록, 없으면 None
+    """
+    try:
+        with _lock:
+            conn = _connect()
+            try:
+                row = conn.execute(
+                    "SELECT fetched_at, models FROM models WHERE provider = ? AND key_hash = ?",
+                    (provider, _key_hash(provider, api_key)),
+                ).fetchone()
+            finally:
+                conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to read model cache", error=str(e))
+        return None
+
+    if row is None or time.time() - row[0] >= ttl:
+        return None
+    return row[1].split("\n") if row[1] else []
+
+
+def put_models(provider: str, api_key: str, models: list[str]):
+    """모델 목록 저장
+
+    Args:
+        provider: 프로바이더 이름 (openai, anthropic)
+        api_key: API 키
+        models: 모델 목록
+    """
+    try:
+        with _lock:
+            conn = _connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO models (provider, key_hash, fetched_at, models) "
+                        "VALUES (?, ?, ?, ?)",
+                        (provider, _key_hash(provider, api_key), time.time(), "\n".join(models)),
+                    )
+            finally:
+                conn.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to write model cache", error=str(e))
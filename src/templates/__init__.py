@@ -51,6 +51,7 @@ from .template_engine import (
 
 # 템플릿 빌더
 from .template_builder import (
+    SlideType,
     TemplateBuilder,
     create_pitch_deck_template,
     create_quarterly_report_template,
@@ -95,6 +96,7 @@ __all__ = [
     "TemplateEngine",
 
     # template_builder
+    "SlideType",
     "TemplateBuilder",
     "create_pitch_deck_template",
     "create_quarterly_report_template",
@@ -3,7 +3,7 @@
 슬라이드 콘텐츠를 분석하여 최적의 레이아웃을 선택합니다.
 """
 
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, TYPE_CHECKING
 from dataclasses import dataclass
 
 from .layout_types import Layout, LayoutType, LayoutCategory, DEFAULT_LAYOUTS
@@ -76,15 +76,49 @@ class LayoutMatcher:
     슬라이드 콘텐츠를 분석하고 가장 적합한 레이아웃을 선택합니다.
     """
 
-    def __init__(self, layouts: Optional[Dict[str, Layout]] = None):
+    # 연속 동일 레이아웃을 피하기 위한 대체 레이아웃
+    _ALTERNATIVES: ClassVar[Dict[LayoutType, LayoutType]] = {
+        LayoutType.SINGLE_COLUMN: LayoutType.BULLET_POINTS,
+        LayoutType.BULLET_POINTS: LayoutType.SINGLE_COLUMN,
+        LayoutType.TWO_COLUMN: LayoutType.IMAGE_RIGHT,
+        LayoutType.IMAGE_LEFT: LayoutType.IMAGE_RIGHT,
+        LayoutType.IMAGE_RIGHT: LayoutType.IMAGE_LEFT,
+        LayoutType.CHART_CENTERED: LayoutType.STATISTICS,
+        LayoutType.STATISTICS: LayoutType.CHART_CENTERED,
+    }
+
+    def __init__(self, layouts: Optional[Dict[Any, Layout]] = None):
         """초기화
 
         Args:
-            layouts: 사용 가능한 레이아웃 딕셔너리
+            layouts: 사용 가능한 레이아웃 딕셔너리 (LayoutType 또는 레이아웃 ID 문자열 키)
         """
-        self.layouts = layouts or {}
+        self.layouts: Dict[LayoutType, Layout] = self._normalize_layouts(layouts or {})
         self._layout_cache: Dict[str, LayoutType] = {}
 
+    @staticmethod
+    def _normalize_layouts(layouts: Dict[Any, Layout]) -> Dict[LayoutType, Layout]:
+        """레이아웃 딕셔너리의 키를 LayoutType으로 통일
+
+        LayoutType에 대응하지 않는 문자열 키는 get_layout으로 조회할 수 없으므로 제외합니다.
+
+        Args:
+            layouts: 문자열 또는 LayoutType 키의 레이아웃 딕셔너리
+
+        Returns:
+            LayoutType 키의 레이아웃 딕셔너리
+        """
+        normalized: Dict[LayoutType, Layout] = {}
+        for key, layout in layouts.items():
+            if isinstance(key, LayoutType):
+                normalized[key] = layout
+                continue
+            try:
+                normalized[LayoutType(key)] = layout
+            except ValueError:
+                continue
+        return normalized
+
     def match(
         self,
         content: Any,
@@ -103,9 +137,60 @@ class LayoutMatcher:
         Returns:
             선택된 레이아웃 타입
         """
-        # 콘텐츠 분석
         analysis = self._analyze_content(content)
+        return self._match_analysis(analysis, slide_index, total_slides, previous_layout)
+
+    def match_batch(
+        self,
+        slides: Sequence[Any],
+        overrides: Optional[Sequence[Optional[LayoutType]]] = None
+    ) -> List[LayoutType]:
+        """여러 슬라이드의 레이아웃을 한 번에 선택
 
+        슬라이드마다 match()를 호출한 것과 같은 결과를 반환하며,
+        지정된 레이아웃이 있는 슬라이드는 콘텐츠 분석을 건너뜁니다.
+
+        Args:
+            slides: 슬라이드 콘텐츠 목록
+            overrides: 슬라이드별로 지정된 레이아웃 (None이면 자동 선택)
+
+        Returns:
+            각 슬라이드의 레이아웃 타입 목록
+        """
+        total = len(slides)
+        n_overrides = len(overrides) if overrides else 0
+        analyze = self._analyze_content
+        match_analysis = self._match_analysis
+        layouts: List[LayoutType] = []
+        previous: Optional[LayoutType] = None
+
+        for i, content in enumerate(slides):
+            layout = overrides[i] if i < n_overrides else None
+            if layout is None:
+                layout = match_analysis(analyze(content), i, total, previous)
+            layouts.append(layout)
+            previous = layout
+
+        return layouts
+
+    def _match_analysis(
+        self,
+        analysis: ContentAnalysis,
+        slide_index: int,
+        total_slides: int,
+        previous_layout: Optional[LayoutType] = None
+    ) -> LayoutType:
+        """분석 결과에 맞는 레이아웃 선택
+
+        Args:
+            analysis: 콘텐츠 분석 결과
+            slide_index: 슬라이드 인덱스 (0부터 시작)
+            total_slides: 전체 슬라이드 수
+            previous_layout: 이전 슬라이드의 레이아웃
+
+        Returns:
+            선택된 레이아웃 타입
+        """
         # 슬라이드 위치에 따른 특수 처리
         if slide_index == 0:
             return self._match_title_slide(analysis)
@@ -262,16 +347,7 @@ class LayoutMatcher:
         Returns:
             대체 레이아웃 타입
         """
-        alternatives = {
-            LayoutType.SINGLE_COLUMN: LayoutType.BULLET_POINTS,
-            LayoutType.BULLET_POINTS: LayoutType.SINGLE_COLUMN,
-            LayoutType.TWO_COLUMN: LayoutType.IMAGE_RIGHT,
-            LayoutType.IMAGE_LEFT: LayoutType.IMAGE_RIGHT,
-            LayoutType.IMAGE_RIGHT: LayoutType.IMAGE_LEFT,
-            LayoutType.CHART_CENTERED: LayoutType.STATISTICS,
-            LayoutType.STATISTICS: LayoutType.CHART_CENTERED,
-        }
-        return alternatives.get(current, current)
+        return self._ALTERNATIVES.get(current, current)
 
     def _is_quote(self, text: Optional[str]) -> bool:
         """인용문 여부 확인
@@ -368,18 +444,11 @@ class LayoutMatcher:
         Returns:
             Layout 객체
         """
-        layout_id = layout_type.value
-
-        # 캐시된 레이아웃 확인
-        if layout_id in self.layouts:
-            return self.layouts[layout_id]
-
-        # 기본 레이아웃에서 조회
-        if layout_type in DEFAULT_LAYOUTS:
-            return DEFAULT_LAYOUTS[layout_type]
-
-        # 기본 단일 열 레이아웃 반환
-        return DEFAULT_LAYOUTS[LayoutType.SINGLE_COLUMN]
+        return (
+            self.layouts.get(layout_type)
+            or DEFAULT_LAYOUTS.get(layout_type)
+            or DEFAULT_LAYOUTS[LayoutType.SINGLE_COLUMN]
+        )
 
     def analyze_presentation(
         self,
@@ -409,25 +478,27 @@ class LayoutMatcher:
         Returns:
             각 슬라이드의 추천 레이아웃 목록
         """
-        suggested = []
-        total = len(slides)
+        # 슬라이드별 분석은 한 번만 수행
+        analyses = self.analyze_presentation(slides)
+        total = len(analyses)
+        suggested: List[LayoutType] = []
+        previous: Optional[LayoutType] = None
+        before_previous: Optional[LayoutType] = None
 
-        for i, slide in enumerate(slides):
-            previous = suggested[-1] if suggested else None
-            layout = self.match(slide, i, total, previous)
+        for i, analysis in enumerate(analyses):
+            layout = self._match_analysis(analysis, i, total, previous)
 
             # 다양성 확보: 3개 연속 동일 레이아웃 방지
-            if ensure_variety and len(suggested) >= 2:
-                if suggested[-1] == suggested[-2] == layout:
-                    analysis = self._analyze_content(slide)
-                    layout = self._get_alternative(layout, analysis)
+            if ensure_variety and layout == previous == before_previous:
+                layout = self._get_alternative(layout, analysis)
 
             suggested.append(layout)
+            before_previous, previous = previous, layout
 
         return suggested
 
 
-def create_layout_matcher(custom_layouts: Optional[Dict[str, Layout]] = None) -> LayoutMatcher:
+def create_layout_matcher(custom_layouts: Optional[Dict[Any, Layout]] = None) -> LayoutMatcher:
     """레이아웃 매처 생성
 
     Args:
@@ -5,7 +5,7 @@
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 
 
 class LayoutCategory(Enum):
@@ -52,7 +52,7 @@ class LayoutType(Enum):
     AGENDA = "agenda"
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutRegion:
     """레이아웃 영역 정의
 
@@ -68,6 +68,10 @@ class LayoutRegion:
     height: int
     accepts: List[str]  # 허용되는 콘텐츠 타입
     style: Optional[Dict[str, Any]] = None
+    _accepts_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._accepts_set = frozenset(self.accepts)
 
     def contains_point(self, px: int, py: int) -> bool:
         """주어진 좌표가 이 영역 내에 있는지 확인"""
@@ -106,6 +110,11 @@ class Layout:
     constraints: Dict[str, Any]
     animations: Optional[Dict[str, Any]] = None
     description: str = ""
+    _accepted_types: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # 모든 영역이 허용하는 콘텐츠 타입의 합집합
+        self._accepted_types = frozenset().union(*(r._accepts_set for r in self.regions))
 
     def get_region(self, region_id: str) -> Optional[LayoutRegion]:
         """ID로 영역 조회"""
@@ -138,10 +147,7 @@ class Layout:
 
     def accepts_content_type(self, content_type: str) -> bool:
         """특정 콘텐츠 타입을 허용하는 영역이 있는지 확인"""
-        for region in self.regions:
-            if content_type in region.accepts:
-                return True
-        return False
+        return content_type in self._accepted_types
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -4,12 +4,121 @@
 """
 
 import json
+import sys
+from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Sequence, Set, Tuple, TypedDict
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
+
+
+class ColorScheme(TypedDict):
+    """템플릿 색상 스키마"""
+    primary: str
+    secondary: str
+    accent: str
+    background: str
+    text: str
+    text_light: str
+
+
+class Typography(TypedDict):
+    """템플릿 타이포그래피 설정"""
+    heading_font: str
+    body_font: str
+    sizes: Dict[str, int]
+    weights: Dict[str, int]
+
+
+class Spacing(TypedDict):
+    """템플릿 간격 설정"""
+    margin: int
+    padding: int
+    gap: int
+
+
+# save()에서 이미 생성을 확인한 디렉토리
+_ENSURED_DIRS: Set[Path] = set()
+
+# 기본 디자인 설정 (읽기 전용, 결과에는 복사본을 넣음)
+_DEFAULT_TYPO_SIZES: Mapping[str, int] = MappingProxyType({
+    "title": 54,
+    "heading1": 44,
+    "heading2": 36,
+    "body": 24,
+    "caption": 18
+})
+
+_DEFAULT_TYPO_WEIGHTS: Mapping[str, int] = MappingProxyType({
+    "title": 700,
+    "heading": 600,
+    "body": 400
+})
+
+_DEFAULT_FONT = "Pretendard"
+
+_DEFAULT_ASSETS: Mapping[str, Any] = MappingProxyType({
+    "master_pptx": "master.pptx",
+    "thumbnail": "thumbnail.png"
+})
+
+# 화면 비율별 기본 해상도 (너비, 높이)
+_ASPECT_PRESETS: Dict[str, Tuple[int, int]] = {
+    "16:9": (1920, 1080),
+    "4:3": (1440, 1080),
+    "16:10": (1920, 1200)
+}
+
+_DEFAULT_SPACING: Mapping[str, int] = MappingProxyType({
+    "margin": 60,
+    "padding": 40,
+    "gap": 24
+})
+
+
+def _default_typography() -> Typography:
+    """기본 타이포그래피 (호출마다 새 딕셔너리)"""
+    return {
+        "heading_font": _DEFAULT_FONT,
+        "body_font": _DEFAULT_FONT,
+        "sizes": dict(_DEFAULT_TYPO_SIZES),
+        "weights": dict(_DEFAULT_TYPO_WEIGHTS)
+    }
+
+
+class SlideType(NamedTuple):
+    """템플릿 구조의 슬라이드 타입 항목"""
+    type: str
+    layout: str
+    required: bool
+    name: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SlideType":
+        """딕셔너리에서 SlideType 생성"""
+        return cls(
+            type=data["type"],
+            layout=data["layout"],
+            required=data.get("required", False),
+            name=data.get("name") or data["type"]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """template.json의 recommended_slides 항목으로 변환"""
+        return {
+            "type": self.type,
+            "layout": self.layout,
+            "required": self.required,
+            "name": self.name
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TemplateBuilder:
     """템플릿 빌더
 
@@ -23,16 +132,34 @@ class TemplateBuilder:
     category: str
     description: str = ""
     tags: List[str] = field(default_factory=list)
-    color_schemes: Dict[str, Dict] = field(default_factory=dict)
+    color_schemes: Dict[str, ColorScheme] = field(default_factory=dict)
     layouts: Dict[str, str] = field(default_factory=dict)
-    structure: List[Dict] = field(default_factory=list)
-    typography: Optional[Dict[str, Any]] = None
-    spacing: Optional[Dict[str, int]] = None
+    structure: List[SlideType] = field(default_factory=list)
+    typography: Optional[Typography] = None
+    spacing: Optional[Spacing] = None
     assets: Optional[Dict[str, Any]] = None
     best_for: List[str] = field(default_factory=list)
     _aspect_ratio: str = "16:9"
     _base_width: int = 1920
     _base_height: int = 1080
+    _tags_seen: Set[str] = field(init=False, repr=False, compare=False)
+    _best_for_seen: Set[str] = field(init=False, repr=False, compare=False)
+    _required_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # 순서는 리스트로 유지하고 중복 검사는 집합으로 수행
+        self._tags_seen = set(self.tags)
+        self._best_for_seen = set(self.best_for)
+        self.structure = [
+            s if isinstance(s, SlideType) else SlideType.from_dict(s)
+            for s in self.structure
+        ]
+        self._required_count = sum(1 for s in self.structure if s.required)
+
+    @property
+    def thumbnail_relpath(self) -> str:
+        """템플릿 디렉토리 기준 썸네일 경로"""
+        return f"{self.category}/{self.id}/thumbnail.png"
 
     def add_tag(self, tag: str) -> "TemplateBuilder":
         """태그 추가
@@ -43,7 +170,8 @@ class TemplateBuilder:
         Returns:
             self (메서드 체이닝)
         """
-        if tag not in self.tags:
+        if tag not in self._tags_seen:
+            self._tags_seen.add(tag)
             self.tags.append(tag)
         return self
 
@@ -56,8 +184,10 @@ class TemplateBuilder:
         Returns:
             self (메서드 체이닝)
         """
-        for tag in tags:
-            self.add_tag(tag)
+        new_tags = [tag for tag in dict.fromkeys(tags) if tag not in self._tags_seen]
+        if new_tags:
+            self.tags.extend(new_tags)
+            self._tags_seen.update(new_tags)
         return self
 
     def add_best_for(self, purpose: str) -> "TemplateBuilder":
@@ -69,7 +199,8 @@ class TemplateBuilder:
         Returns:
             self (메서드 체이닝)
         """
-        if purpose not in self.best_for:
+        if purpose not in self._best_for_seen:
+            self._best_for_seen.add(purpose)
             self.best_for.append(purpose)
         return self
 
@@ -97,7 +228,7 @@ class TemplateBuilder:
         Returns:
             self (메서드 체이닝)
         """
-        self.color_schemes[name] = {
+        self.color_schemes[sys.intern(name)] = {
             "primary": primary,
             "secondary": secondary,
             "accent": accent,
@@ -112,7 +243,7 @@ class TemplateBuilder:
         type_name: str,
         layout: str,
         required: bool = False,
-        name_ko: str = ""
+        name_ko: Optional[str] = None
     ) -> "TemplateBuilder":
         """슬라이드 타입 추가
 
@@ -120,17 +251,47 @@ class TemplateBuilder:
             type_name: 타입 이름 (예: "title", "problem", "solution")
             layout: 기본 레이아웃 이름
             required: 필수 여부
-            name_ko: 한글 이름
+            name_ko: 한글 이름 (없으면 타입 이름 사용)
+
+        Returns:
+            self (메서드 체이닝)
+        """
+        type_name = sys.intern(type_name)
+        self.structure.append(SlideType(
+            type=type_name,
+            layout=sys.intern(layout),
+            required=required,
+            name=name_ko or type_name
+        ))
+        if required:
+            self._required_count += 1
+        return self
+
+    def add_slide_types(
+        self,
+        entries: Sequence[Tuple[str, str, bool, Optional[str]]]
+    ) -> "TemplateBuilder":
+        """여러 슬라이드 타입 추가
+
+        Args:
+            entries: (타입 이름, 기본 레이아웃, 필수 여부, 한글 이름) 튜플 목록
 
         Returns:
             self (메서드 체이닝)
         """
-        self.structure.append({
-            "type": type_name,
-            "layout": layout,
-            "required": required,
-            "name": name_ko or type_name
-        })
+        intern = sys.intern
+        new_types = [
+            SlideType(
+                type=intern(type_name),
+                layout=intern(layout),
+                required=required,
+                name=name_ko or intern(type_name)
+            )
+            for type_name, layout, required, name_ko in entries
+        ]
+        if new_types:
+            self.structure.extend(new_types)
+            self._required_count += sum(1 for s in new_types if s.required)
         return self
 
     def set_default_layout(
@@ -147,7 +308,7 @@ class TemplateBuilder:
         Returns:
             self (메서드 체이닝)
         """
-        self.layouts[slide_type] = layout
+        self.layouts[sys.intern(slide_type)] = sys.intern(layout)
         return self
 
     def set_typography(
@@ -162,8 +323,8 @@ class TemplateBuilder:
         Args:
             heading_font: 제목 폰트
             body_font: 본문 폰트
-            sizes: 폰트 크기 딕셔너리
-            weights: 폰트 굵기 딕셔너리
+            sizes: 폰트 크기 딕셔너리 (None이면 기본값)
+            weights: 폰트 굵기 딕셔너리 (None이면 기본값)
 
         Returns:
             self (메서드 체이닝)
@@ -171,18 +332,8 @@ class TemplateBuilder:
         self.typography = {
             "heading_font": heading_font,
             "body_font": body_font,
-            "sizes": sizes or {
-                "title": 54,
-                "heading1": 44,
-                "heading2": 36,
-                "body": 24,
-                "caption": 18
-            },
-            "weights": weights or {
-                "title": 700,
-                "heading": 600,
-                "body": 400
-            }
+            "sizes": sizes if sizes is not None else dict(_DEFAULT_TYPO_SIZES),
+            "weights": weights if weights is not None else dict(_DEFAULT_TYPO_WEIGHTS)
         }
         return self
 
@@ -230,15 +381,10 @@ class TemplateBuilder:
         if width and height:
             self._base_width = width
             self._base_height = height
-        elif ratio == "16:9":
-            self._base_width = 1920
-            self._base_height = 1080
-        elif ratio == "4:3":
-            self._base_width = 1440
-            self._base_height = 1080
-        elif ratio == "16:10":
-            self._base_width = 1920
-            self._base_height = 1200
+        else:
+            self._base_width, self._base_height = _ASPECT_PRESETS.get(
+                ratio, (self._base_width, self._base_height)
+            )
 
         return self
 
@@ -274,33 +420,11 @@ class TemplateBuilder:
         Returns:
             템플릿 정의 딕셔너리
         """
-        # 필수 슬라이드 수 계산
-        required_count = len([s for s in self.structure if s.get("required")])
-
         # 기본 타이포그래피 설정
-        typography = self.typography or {
-            "heading_font": "Pretendard",
-            "body_font": "Pretendard",
-            "sizes": {
-                "title": 54,
-                "heading1": 44,
-                "heading2": 36,
-                "body": 24,
-                "caption": 18
-            },
-            "weights": {
-                "title": 700,
-                "heading": 600,
-                "body": 400
-            }
-        }
+        typography = self.typography or _default_typography()
 
         # 기본 간격 설정
-        spacing = self.spacing or {
-            "margin": 60,
-            "padding": 40,
-            "gap": 24
-        }
+        spacing = self.spacing or dict(_DEFAULT_SPACING)
 
         return {
             "id": self.id,
@@ -322,18 +446,15 @@ class TemplateBuilder:
                 "spacing": spacing
             },
             "structure": {
-                "recommended_slides": self.structure,
-                "min_slides": max(3, required_count),
+                "recommended_slides": [s.to_dict() for s in self.structure],
+                "min_slides": max(3, self._required_count),
                 "max_slides": 20,
                 "optimal_slides": len(self.structure)
             },
             "layouts": self.layouts,
             "tags": self.tags,
             "best_for": self.best_for,
-            "assets": self.assets or {
-                "master_pptx": "master.pptx",
-                "thumbnail": "thumbnail.png"
-            }
+            "assets": self.assets or dict(_DEFAULT_ASSETS)
         }
 
     def save(self, templates_dir: str = "templates") -> Path:
@@ -347,14 +468,24 @@ class TemplateBuilder:
         """
         template_data = self.build()
 
-        # 디렉토리 생성
+        # 디렉토리 생성 (이미 생성한 디렉토리는 건너뜀)
         template_path = Path(templates_dir) / self.category / self.id
-        template_path.mkdir(parents=True, exist_ok=True)
+        if template_path not in _ENSURED_DIRS:
+            template_path.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(template_path)
 
         # template.json 저장
         json_path = template_path / "template.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(template_data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(template_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(template_data, ensure_ascii=False, indent=2).encode('utf-8')
+        try:
+            json_path.write_bytes(payload)
+        except FileNotFoundError:
+            # 생성 후 외부에서 디렉토리가 삭제된 경우
+            template_path.mkdir(parents=True, exist_ok=True)
+            json_path.write_bytes(payload)
 
         return json_path
 
@@ -367,8 +498,6 @@ class TemplateBuilder:
         Returns:
             인덱스에 추가할 템플릿 엔트리
         """
-        from datetime import date
-
         today = date.today().isoformat()
 
         return {
@@ -378,7 +507,7 @@ class TemplateBuilder:
             "category": self.category,
             "description": self.description,
             "tags": self.tags,
-            "thumbnail": f"{self.category}/{self.id}/thumbnail.png",
+            "thumbnail": self.thumbnail_relpath,
             "slides_count": len(self.structure),
             "color_schemes": list(self.color_schemes.keys()),
             "best_for": self.best_for,
@@ -441,18 +570,20 @@ def create_pitch_deck_template() -> TemplateBuilder:
     )
 
     # 슬라이드 구조 정의
-    builder.add_slide_type("title", "title_centered", required=True, name_ko="표지")
-    builder.add_slide_type("problem", "two_column", required=True, name_ko="문제 정의")
-    builder.add_slide_type("solution", "image_left", required=True, name_ko="해결책")
-    builder.add_slide_type("product", "image_right", required=False, name_ko="제품/서비스")
-    builder.add_slide_type("market", "chart_centered", required=True, name_ko="시장 규모")
-    builder.add_slide_type("business_model", "two_column", required=True, name_ko="비즈니스 모델")
-    builder.add_slide_type("traction", "statistics", required=False, name_ko="성과/지표")
-    builder.add_slide_type("competition", "comparison", required=False, name_ko="경쟁 분석")
-    builder.add_slide_type("team", "team_grid", required=True, name_ko="팀 소개")
-    builder.add_slide_type("financials", "chart_centered", required=False, name_ko="재무 계획")
-    builder.add_slide_type("ask", "single_column", required=True, name_ko="투자 요청")
-    builder.add_slide_type("contact", "contact", required=True, name_ko="연락처")
+    builder.add_slide_types([
+        ("title", "title_centered", True, "표지"),
+        ("problem", "two_column", True, "문제 정의"),
+        ("solution", "image_left", True, "해결책"),
+        ("product", "image_right", False, "제품/서비스"),
+        ("market", "chart_centered", True, "시장 규모"),
+        ("business_model", "two_column", True, "비즈니스 모델"),
+        ("traction", "statistics", False, "성과/지표"),
+        ("competition", "comparison", False, "경쟁 분석"),
+        ("team", "team_grid", True, "팀 소개"),
+        ("financials", "chart_centered", False, "재무 계획"),
+        ("ask", "single_column", True, "투자 요청"),
+        ("contact", "contact", True, "연락처"),
+    ])
 
     # 에셋 설정
     builder.set_assets(
@@ -502,17 +633,19 @@ def create_quarterly_report_template() -> TemplateBuilder:
         text_light="#9ca3af"
     )
 
-    builder.add_slide_type("title", "title_centered", required=True, name_ko="표지")
-    builder.add_slide_type("agenda", "bullet_points", required=True, name_ko="목차")
-    builder.add_slide_type("executive_summary", "two_column", required=True, name_ko="요약")
-    builder.add_slide_type("financial_highlights", "statistics", required=True, name_ko="재무 하이라이트")
-    builder.add_slide_type("revenue", "chart_centered", required=True, name_ko="매출 분석")
-    builder.add_slide_type("expenses", "chart_centered", required=False, name_ko="비용 분석")
-    builder.add_slide_type("kpis", "statistics", required=True, name_ko="핵심 지표")
-    builder.add_slide_type("achievements", "bullet_points", required=False, name_ko="주요 성과")
-    builder.add_slide_type("challenges", "two_column", required=False, name_ko="도전과제")
-    builder.add_slide_type("outlook", "single_column", required=True, name_ko="전망")
-    builder.add_slide_type("conclusion", "single_column", required=True, name_ko="결론")
+    builder.add_slide_types([
+        ("title", "title_centered", True, "표지"),
+        ("agenda", "bullet_points", True, "목차"),
+        ("executive_summary", "two_column", True, "요약"),
+        ("financial_highlights", "statistics", True, "재무 하이라이트"),
+        ("revenue", "chart_centered", True, "매출 분석"),
+        ("expenses", "chart_centered", False, "비용 분석"),
+        ("kpis", "statistics", True, "핵심 지표"),
+        ("achievements", "bullet_points", False, "주요 성과"),
+        ("challenges", "two_column", False, "도전과제"),
+        ("outlook", "single_column", True, "전망"),
+        ("conclusion", "single_column", True, "결론"),
+    ])
 
     return builder
 
@@ -556,14 +689,16 @@ def create_lecture_template() -> TemplateBuilder:
         text_light="#78716c"
     )
 
-    builder.add_slide_type("title", "title_with_subtitle", required=True, name_ko="표지")
-    builder.add_slide_type("learning_objectives", "bullet_points", required=True, name_ko="학습 목표")
-    builder.add_slide_type("introduction", "single_column", required=True, name_ko="도입")
-    builder.add_slide_type("content", "two_column", required=True, name_ko="본문")
-    builder.add_slide_type("example", "image_right", required=False, name_ko="예시")
-    builder.add_slide_type("key_concepts", "bullet_points", required=True, name_ko="핵심 개념")
-    builder.add_slide_type("summary", "single_column", required=True, name_ko="요약")
-    builder.add_slide_type("questions", "contact", required=True, name_ko="질문")
+    builder.add_slide_types([
+        ("title", "title_with_subtitle", True, "표지"),
+        ("learning_objectives", "bullet_points", True, "학습 목표"),
+        ("introduction", "single_column", True, "도입"),
+        ("content", "two_column", True, "본문"),
+        ("example", "image_right", False, "예시"),
+        ("key_concepts", "bullet_points", True, "핵심 개념"),
+        ("summary", "single_column", True, "요약"),
+        ("questions", "contact", True, "질문"),
+    ])
 
     return builder
 
@@ -607,14 +742,17 @@ def create_product_launch_template() -> TemplateBuilder:
         text_light="#64748b"
     )
 
-    builder.add_slide_type("title", "title_image_background", required=True, name_ko="표지")
-    builder.add_slide_type("teaser", "image_full", required=False, name_ko="티저")
-    builder.add_slide_type("reveal", "image_full", required=True, name_ko="제품 공개")
-    builder.add_slide_type("features", "two_column", required=True, name_ko="주요 기능")
-    builder.add_slide_type("benefits", "bullet_points", required=True, name_ko="핵심 혜택")
-    builder.add_slide_type("demo", "image_left", required=False, name_ko="데모")
-    builder.add_slide_type("pricing", "comparison", required=True, name_ko="가격")
-    builder.add_slide_type("availability", "single_column", required=True, name_ko="출시 일정")
-    builder.add_slide_type("cta", "contact", required=True, name_ko="행동 촉구")
+    builder.add_slide_types([
+        ("title", "title_image_background", True, "표지"),
+        ("teaser", "image_full", False, "티저"),
+        ("reveal", "image_full", True, "제품 공개"),
+        ("features", "two_column", True, "주요 기능"),
+        ("benefits", "bullet_points", True, "핵심 혜택"),
+        ("demo", "image_left", False, "데모"),
+        ("pricing", "comparison", True, "가격"),
+        ("availability", "single_column", True, "출시 일정"),
+        ("cta", "contact", True, "행동 촉구"),
+    ])
 
     return builder
+
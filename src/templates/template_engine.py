@@ -4,20 +4,143 @@
 """
 
 import json
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
-from pathlib import Path
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
+from pathlib import Path
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
 
-from .template_loader import TemplateLoader
-from .layout_matcher import LayoutMatcher, ContentAnalysis
-from .layout_types import Layout, LayoutType, LayoutCategory, LayoutRegion, DEFAULT_LAYOUTS
 from .color_schemes import ColorPalette, get_color_scheme
+from .layout_matcher import ContentAnalysis, LayoutMatcher
+from .layout_types import DEFAULT_LAYOUTS, Layout, LayoutCategory, LayoutRegion, LayoutType
+from .template_loader import TemplateLoader
 
 if TYPE_CHECKING:
     pass
 
 
-@dataclass
+# 카테고리 추론 키워드 (우선순위 순, 소문자로 비교)
+_CATEGORY_KEYWORDS = (
+    ("business", frozenset({
+        '투자', '사업', '비즈니스', 'business', '제안', '보고',
+        '매출', '실적', '전략', '계획', '스타트업', 'startup',
+        '회사', '기업', '프로젝트', '분기', '연간'
+    })),
+    ("education", frozenset({
+        '강의', '교육', '학습', '연구', '논문', 'research',
+        '워크샵', '세미나', '튜토리얼', 'tutorial', '학교',
+        '대학', '수업', '강좌', '트레이닝'
+    })),
+    ("marketing", frozenset({
+        '마케팅', 'marketing', '캠페인', '브랜드', '제품',
+        '런칭', 'launch', '홍보', '광고', '소셜',
+        '프로모션', '이벤트'
+    })),
+    ("creative", frozenset({
+        '포트폴리오', 'portfolio', '디자인', '창작', '아트',
+        '스토리', '케이스', '쇼케이스'
+    })),
+)
+
+# 카테고리별 키워드를 정규식 하나로 컴파일
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, sorted(keywords)))))
+    for category, keywords in _CATEGORY_KEYWORDS
+)
+
+
+@lru_cache(maxsize=512)
+def _infer_category(topic: str, purpose: Optional[str]) -> str:
+    """카테고리 추론
+
+    Args:
+        topic: 주제
+        purpose: 목적
+
+    Returns:
+        추론된 카테고리 ID
+    """
+    combined = topic.lower() + ' ' + (purpose or "").lower()
+
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(combined):
+            return category
+
+    return "business"  # 기본값
+
+
+# 값 → Enum 조회 테이블 (try/except 대신 사용, Enum 멤버 자신도 키로 허용)
+_LAYOUT_BY_VALUE: Dict[Any, LayoutType] = {m.value: m for m in LayoutType}
+_LAYOUT_BY_VALUE.update({m: m for m in LayoutType})
+_CATEGORY_BY_VALUE: Dict[Any, LayoutCategory] = {m.value: m for m in LayoutCategory}
+_CATEGORY_BY_VALUE.update({m: m for m in LayoutCategory})
+
+
+def _infer_layout_category(layout_id: str) -> str:
+    """레이아웃 ID의 이름 규칙으로 카테고리 추론"""
+    if 'title' in layout_id:
+        return 'title'
+    if 'image' in layout_id:
+        return 'image'
+    if 'chart' in layout_id or 'statistics' in layout_id or 'comparison' in layout_id:
+        return 'data'
+    if layout_id in ('quote', 'timeline', 'team_grid', 'contact', 'agenda'):
+        return 'special'
+    return 'content'
+
+
+# 알려진 레이아웃 ID의 카테고리 (그 외 ID는 이름 규칙으로 추론)
+_LAYOUT_CATEGORY_MAP: Dict[str, str] = {
+    m.value: _infer_layout_category(m.value) for m in LayoutType
+}
+
+
+@lru_cache(maxsize=128)
+def _read_layout_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """레이아웃 JSON 파일 파싱 (경로와 수정 시각 기준으로 엔진 간 공유 캐싱)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _extract_slide_content(slide: Any) -> Dict[str, Any]:
+    """슬라이드 객체에서 SlideSpec 콘텐츠 딕셔너리 추출
+
+    SlideContent 외에 임의의 객체도 지원하며, 없는 속성은 기본값을 사용합니다.
+    """
+    return {
+        "title": getattr(slide, 'title', ''),
+        "subtitle": getattr(slide, 'subtitle', ''),
+        "content": getattr(slide, 'content', ''),
+        "bullet_points": getattr(slide, 'bullet_points', []),
+        "notes": getattr(slide, 'notes', '')
+    }
+
+
+class _SimpleSlide:
+    """슬라이드 데이터 딕셔너리를 LayoutMatcher가 읽는 속성 형태로 감싼 객체"""
+
+    __slots__ = ("title", "subtitle", "content", "bullet_points", "image_url", "chart_data")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.title = data.get("title", "")
+        self.subtitle = data.get("subtitle", "")
+        self.content = data.get("content", "")
+        self.bullet_points = data.get("bullet_points", [])
+        self.image_url = data.get("image_url")
+        self.chart_data = data.get("chart_data")
+
+
+@dataclass(slots=True)
 class SlideSpec:
     """슬라이드 사양
 
@@ -51,7 +174,7 @@ class SlideSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PresentationSpec:
     """프레젠테이션 사양
 
@@ -75,6 +198,15 @@ class PresentationSpec:
             "aspect_ratio": self.aspect_ratio
         }
 
+    def to_json_bytes(self) -> bytes:
+        """UTF-8 JSON 바이트로 직렬화 (orjson이 있으면 사용)"""
+        if orjson is not None:
+            # orjson은 데이터클래스와 Enum을 직접 직렬화하므로 to_dict()를 거치지 않음
+            return orjson.dumps(self)
+        return json.dumps(
+            self.to_dict(), ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PresentationSpec":
         """딕셔너리에서 생성"""
@@ -115,6 +247,7 @@ class TemplateEngine:
         self.loader = TemplateLoader(templates_dir)
         self.layout_matcher = LayoutMatcher({})
         self._layouts_cache: Dict[str, Layout] = {}
+        self._layout_root = os.path.join(str(self.loader.templates_dir), "layouts")
 
     def recommend_template(
         self,
@@ -135,7 +268,7 @@ class TemplateEngine:
             추천 템플릿 ID
         """
         # 키워드 기반 카테고리 추론
-        category = self._infer_category(topic, purpose)
+        category = _infer_category(topic, purpose)
 
         # 해당 카테고리의 인기 템플릿 조회
         templates = self.loader.list_templates(category=category)
@@ -146,63 +279,6 @@ class TemplateEngine:
         # 기본 템플릿
         return "pitch_deck"
 
-    def _infer_category(
-        self,
-        topic: str,
-        purpose: Optional[str]
-    ) -> str:
-        """카테고리 추론
-
-        Args:
-            topic: 주제
-            purpose: 목적
-
-        Returns:
-            추론된 카테고리 ID
-        """
-        topic_lower = topic.lower()
-        purpose_lower = (purpose or "").lower()
-
-        # 비즈니스 키워드
-        business_keywords = [
-            '투자', '사업', '비즈니스', 'business', '제안', '보고',
-            '매출', '실적', '전략', '계획', '스타트업', 'startup',
-            '회사', '기업', '프로젝트', '분기', '연간'
-        ]
-
-        # 교육 키워드
-        education_keywords = [
-            '강의', '교육', '학습', '연구', '논문', 'research',
-            '워크샵', '세미나', '튜토리얼', 'tutorial', '학교',
-            '대학', '수업', '강좌', '트레이닝'
-        ]
-
-        # 마케팅 키워드
-        marketing_keywords = [
-            '마케팅', 'marketing', '캠페인', '브랜드', '제품',
-            '런칭', 'launch', '홍보', 'PR', '광고', '소셜',
-            '프로모션', '이벤트'
-        ]
-
-        # 크리에이티브 키워드
-        creative_keywords = [
-            '포트폴리오', 'portfolio', '디자인', '창작', '아트',
-            '스토리', '케이스', '쇼케이스'
-        ]
-
-        combined = topic_lower + ' ' + purpose_lower
-
-        if any(kw in combined for kw in business_keywords):
-            return "business"
-        if any(kw in combined for kw in education_keywords):
-            return "education"
-        if any(kw in combined for kw in marketing_keywords):
-            return "marketing"
-        if any(kw in combined for kw in creative_keywords):
-            return "creative"
-
-        return "business"  # 기본값
-
     def create_presentation_spec(
         self,
         template_id: str,
@@ -223,51 +299,35 @@ class TemplateEngine:
         if not template:
             template = self._get_default_template()
 
-        slides = []
         content_slides = getattr(content_context, 'slides', [])
         design_slides = getattr(design_context, 'slides', [])
-        total = len(content_slides)
-
-        for i, slide_content in enumerate(content_slides):
-            # 디자인 컨텍스트에서 레이아웃 가져오기
-            slide_design = design_slides[i] if i < len(design_slides) else None
-
-            # 레이아웃 결정
-            if slide_design and hasattr(slide_design, 'layout_type'):
-                try:
-                    layout_type = LayoutType(slide_design.layout_type)
-                except ValueError:
-                    layout_type = self.layout_matcher.match(
-                        slide_content,
-                        i,
-                        total,
-                        slides[-1].layout if slides else None
-                    )
-            else:
-                layout_type = self.layout_matcher.match(
-                    slide_content,
-                    i,
-                    total,
-                    slides[-1].layout if slides else None
-                )
+        color_scheme = getattr(design_context, 'color_scheme', 'professional')
+
+        # 1단계: 디자인 컨텍스트에 지정된 레이아웃을 반영해 전체 레이아웃을 한 번에 결정
+        layout_types = self.layout_matcher.match_batch(
+            content_slides,
+            [
+                _LAYOUT_BY_VALUE.get(getattr(slide_design, 'layout_type', None))
+                for slide_design in design_slides[:len(content_slides)]
+            ]
+        )
 
-            # 슬라이드 사양 생성
-            slide_spec = SlideSpec(
+        # 2단계: 슬라이드 사양 생성
+        slides = [
+            SlideSpec(
                 index=i,
                 layout=layout_type,
-                content={
-                    "title": getattr(slide_content, 'title', ''),
-                    "subtitle": getattr(slide_content, 'subtitle', ''),
-                    "content": getattr(slide_content, 'content', ''),
-                    "bullet_points": getattr(slide_content, 'bullet_points', []),
-                    "notes": getattr(slide_content, 'notes', '')
-                },
+                content=_extract_slide_content(slide_content),
                 design={
-                    "color_scheme": getattr(design_context, 'color_scheme', 'professional'),
-                    "emphasis": getattr(slide_design, 'color_emphasis', None) if slide_design else None
+                    "color_scheme": color_scheme,
+                    "emphasis": getattr(slide_design, 'color_emphasis', None)
                 }
             )
-            slides.append(slide_spec)
+            # 디자인 슬라이드가 모자라면 None으로 채움 (남는 디자인 슬라이드는 무시)
+            for i, (slide_content, slide_design, layout_type) in enumerate(
+                zip(content_slides, chain(design_slides, repeat(None)), layout_types)
+            )
+        ]
 
         # 타이포그래피 설정
         typography = template.get("design", {}).get("typography", {
@@ -277,7 +337,7 @@ class TemplateEngine:
 
         return PresentationSpec(
             template_id=template_id,
-            color_scheme=getattr(design_context, 'color_scheme', 'professional'),
+            color_scheme=color_scheme,
             slides=slides,
             metadata={
                 "title": getattr(content_context, 'title', ''),
@@ -314,17 +374,13 @@ class TemplateEngine:
 
         slides = []
         total = len(slides_data)
+        prev_layout: Optional[LayoutType] = None
 
         for i, slide_data in enumerate(slides_data):
             # 레이아웃 결정
-            layout_str = slide_data.get("layout")
-            if layout_str:
-                try:
-                    layout_type = LayoutType(layout_str)
-                except ValueError:
-                    layout_type = self._infer_layout(slide_data, i, total, slides)
-            else:
-                layout_type = self._infer_layout(slide_data, i, total, slides)
+            layout_type = _LAYOUT_BY_VALUE.get(slide_data.get("layout"))
+            if layout_type is None:
+                layout_type = self._infer_layout(slide_data, i, total, prev_layout)
 
             slide_spec = SlideSpec(
                 index=i,
@@ -342,6 +398,7 @@ class TemplateEngine:
                 }
             )
             slides.append(slide_spec)
+            prev_layout = layout_type
 
         return PresentationSpec(
             template_id=template_id,
@@ -361,21 +418,11 @@ class TemplateEngine:
         slide_data: Dict[str, Any],
         index: int,
         total: int,
-        previous_slides: List[SlideSpec]
+        previous_layout: Optional[LayoutType]
     ) -> LayoutType:
         """슬라이드 데이터에서 레이아웃 추론"""
         # 간단한 객체 생성하여 매처에 전달
-        class SimpleSlide:
-            def __init__(self, data):
-                self.title = data.get("title", "")
-                self.subtitle = data.get("subtitle", "")
-                self.content = data.get("content", "")
-                self.bullet_points = data.get("bullet_points", [])
-                self.image_url = data.get("image_url")
-                self.chart_data = data.get("chart_data")
-
-        simple_slide = SimpleSlide(slide_data)
-        previous_layout = previous_slides[-1].layout if previous_slides else None
+        simple_slide = _SimpleSlide(slide_data)
 
         return self.layout_matcher.match(simple_slide, index, total, previous_layout)
 
@@ -431,6 +478,26 @@ class TemplateEngine:
 
         return layout
 
+    def prewarm_layouts(self, spec: PresentationSpec, max_workers: int = 8) -> None:
+        """프레젠테이션에서 사용하는 레이아웃을 미리 로드
+
+        서로 다른 레이아웃 파일을 스레드 풀에서 동시에 읽어 캐시에 채워두므로,
+        이후 슬라이드별 get_layout 호출은 디스크 I/O 없이 처리됩니다.
+
+        Args:
+            spec: 프레젠테이션 사양
+            max_workers: 최대 스레드 수
+        """
+        pending = {s.layout for s in spec.slides if s.layout.value not in self._layouts_cache}
+        if len(pending) <= 1:
+            for layout_type in pending:
+                self.get_layout(layout_type)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            # 결과는 get_layout이 캐시에 저장하므로 완료만 기다림
+            list(executor.map(self.get_layout, pending))
+
     def _load_layout(self, layout_id: str) -> Layout:
         """레이아웃 파일 로드
 
@@ -443,12 +510,16 @@ class TemplateEngine:
         # 레이아웃 카테고리 결정
         category = self._get_layout_category(layout_id)
 
-        layout_path = self.loader.templates_dir / "layouts" / category / f"{layout_id}.json"
+        layout_path = os.path.join(self._layout_root, category, layout_id + ".json")
 
-        if layout_path.exists():
-            with open(layout_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return self._parse_layout(data)
+        # os.path.isfile과 같은 판정을 stat 한 번으로 수행하고 수정 시각도 함께 얻음
+        try:
+            st = os.stat(layout_path)
+        except OSError:
+            st = None
+
+        if st is not None and S_ISREG(st.st_mode):
+            return self._parse_layout(_read_layout_json(layout_path, st.st_mtime_ns))
 
         # 기본 레이아웃 반환
         return self._get_default_layout(layout_id)
@@ -462,15 +533,10 @@ class TemplateEngine:
         Returns:
             카테고리 이름
         """
-        if 'title' in layout_id:
-            return 'title'
-        if 'image' in layout_id:
-            return 'image'
-        if 'chart' in layout_id or 'statistics' in layout_id or 'comparison' in layout_id:
-            return 'data'
-        if layout_id in ['quote', 'timeline', 'team_grid', 'contact', 'agenda']:
-            return 'special'
-        return 'content'
+        category = _LAYOUT_CATEGORY_MAP.get(layout_id)
+        if category is None:
+            category = _infer_layout_category(layout_id)
+        return category
 
     def _parse_layout(self, data: Dict) -> Layout:
         """레이아웃 데이터 파싱
@@ -481,35 +547,29 @@ class TemplateEngine:
         Returns:
             Layout 객체
         """
-        regions = []
-        for r in data.get("regions", []):
-            pos = r.get("position", {})
-            region = LayoutRegion(
+        region_cls = LayoutRegion
+        regions = [
+            region_cls(
                 id=r["id"],
                 type=r["type"],
                 purpose=r["purpose"],
-                x=pos.get("x", 0),
+                x=(pos := r.get("position", {})).get("x", 0),
                 y=pos.get("y", 0),
                 width=pos.get("width", 100),
                 height=pos.get("height", 100),
                 accepts=r.get("accepts", []),
                 style=r.get("style")
             )
-            regions.append(region)
+            for r in data.get("regions", ())
+        ]
 
         # layout_type 결정
         layout_id = data["id"]
-        try:
-            layout_type = LayoutType(layout_id)
-        except ValueError:
-            layout_type = LayoutType.SINGLE_COLUMN
+        layout_type = _LAYOUT_BY_VALUE.get(layout_id, LayoutType.SINGLE_COLUMN)
 
         # category 결정
         category_str = data.get("category", self._get_layout_category(layout_id))
-        try:
-            category = LayoutCategory(category_str)
-        except ValueError:
-            category = LayoutCategory.CONTENT
+        category = _CATEGORY_BY_VALUE.get(category_str, LayoutCategory.CONTENT)
 
         return Layout(
             id=layout_id,
@@ -532,12 +592,9 @@ class TemplateEngine:
             Layout 객체
         """
         # DEFAULT_LAYOUTS에서 찾기
-        try:
-            layout_type = LayoutType(layout_id)
-            if layout_type in DEFAULT_LAYOUTS:
-                return DEFAULT_LAYOUTS[layout_type]
-        except ValueError:
-            pass
+        layout_type = _LAYOUT_BY_VALUE.get(layout_id)
+        if layout_type in DEFAULT_LAYOUTS:
+            return DEFAULT_LAYOUTS[layout_type]
 
         # 기본 단일 열 레이아웃 생성
         return Layout(
@@ -623,13 +680,11 @@ class TemplateEngine:
         Returns:
             검증 오류 메시지 목록 (비어있으면 유효함)
         """
-        errors = []
-
         if not spec.slides:
-            errors.append("슬라이드가 없습니다.")
+            return ["슬라이드가 없습니다."]
 
-        for i, slide in enumerate(spec.slides):
-            if not slide.content.get("title"):
-                errors.append(f"슬라이드 {i + 1}: 제목이 없습니다.")
-
-        return errors
+        return [
+            f"슬라이드 {i}: 제목이 없습니다."
+            for i, slide in enumerate(spec.slides, 1)
+            if not slide.content.get("title")
+        ]
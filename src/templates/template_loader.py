@@ -4,12 +4,55 @@
 """
 
 import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성
+    orjson = None
 
-@dataclass
+
+# 메모리에 유지할 template.json 최대 개수
+_MAX_CACHED_TEMPLATES = 32
+
+# 메모리에 유지할 검색 결과 최대 개수 (검색어별)
+_MAX_CACHED_SEARCHES = 64
+
+# list_templates 정렬 기준별 키와 내림차순 여부
+_SORT_KEYS = {
+    "popularity": attrgetter("popularity"),
+    "name": attrgetter("name"),
+    "created_at": attrgetter("created_at"),
+}
+_SORT_REVERSE = {"popularity": True, "name": False, "created_at": True}
+
+# 이 크기 이상의 파일은 메모리 매핑해 복사 없이 파싱
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_json(path: Path) -> Dict:
+    """JSON 파일 파싱 (orjson이 있으면 사용)"""
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+
+        # orjson은 memoryview를 직접 파싱하므로 bytes 사본을 만들지 않음
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+@dataclass(slots=True)
 class TemplateInfo:
     """템플릿 정보
 
@@ -28,6 +71,38 @@ class TemplateInfo:
     popularity: int
     created_at: str = ""
     updated_at: str = ""
+    # 검색용 소문자 필드 (생성 시 한 번 계산)
+    _name_lc: str = field(init=False, repr=False, compare=False)
+    _name_ko_lc: str = field(init=False, repr=False, compare=False)
+    _desc_lc: str = field(init=False, repr=False, compare=False)
+    _tags_lc: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _best_for_lc: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._name_lc = self.name.lower()
+        self._name_ko_lc = self.name_ko.lower()
+        self._desc_lc = self.description.lower()
+        self._tags_lc = tuple(tag.lower() for tag in self.tags)
+        self._best_for_lc = tuple(bf.lower() for bf in self.best_for)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TemplateInfo":
+        """인덱스 항목 딕셔너리에서 생성"""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            name_ko=data.get("name_ko", data["name"]),
+            category=data["category"],
+            description=data.get("description", ""),
+            tags=data.get("tags", []),
+            thumbnail_path=data.get("thumbnail", ""),
+            slides_count=data.get("slides_count", 10),
+            color_schemes=data.get("color_schemes", []),
+            best_for=data.get("best_for", []),
+            popularity=data.get("popularity", 0),
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", "")
+        )
 
     def matches_query(self, query: str) -> int:
         """검색어와의 매칭 점수 계산
@@ -42,22 +117,22 @@ class TemplateInfo:
         score = 0
 
         # 이름 매칭
-        if query_lower in self.name.lower():
+        if query_lower in self._name_lc:
             score += 10
-        if query_lower in self.name_ko:
+        if query_lower in self._name_ko_lc:
             score += 10
 
         # 태그 매칭
-        for tag in self.tags:
-            if query_lower in tag.lower():
+        for tag in self._tags_lc:
+            if query_lower in tag:
                 score += 5
 
         # 설명 매칭
-        if query_lower in self.description.lower():
+        if query_lower in self._desc_lc:
             score += 3
 
         # best_for 매칭
-        for bf in self.best_for:
+        for bf in self._best_for_lc:
             if query_lower in bf:
                 score += 7
 
@@ -82,7 +157,7 @@ class TemplateInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryInfo:
     """카테고리 정보"""
     id: str
@@ -107,6 +182,8 @@ class TemplateLoader:
     """템플릿 로더
 
     템플릿 인덱스와 개별 템플릿 파일을 로드합니다.
+    목록, 검색, 정보 조회는 인덱스만 사용하며, 개별 template.json은
+    get_template, get_master_pptx_path, get_recommended_slides 호출 시에만 필요할 때 로드합니다.
     """
 
     def __init__(self, templates_dir: str = "templates"):
@@ -117,8 +194,16 @@ class TemplateLoader:
         """
         self.templates_dir = Path(templates_dir)
         self._index: Optional[Dict] = None
-        self._templates: Dict[str, Dict] = {}
+        self._index_lock = threading.Lock()
+        # 최근 사용 순서로 유지하는 template.json 캐시 (최대 _MAX_CACHED_TEMPLATES개)
+        self._templates: "OrderedDict[str, Dict]" = OrderedDict()
         self._categories: List[CategoryInfo] = []
+        # 인덱스 순서의 TemplateInfo 목록과 ID 조회용 맵 (인덱스 로드 시 한 번 생성)
+        self._infos: List[TemplateInfo] = []
+        self._info_by_id: Dict[str, TemplateInfo] = {}
+        self._meta_by_id: Dict[str, Dict] = {}
+        # 소문자 검색어 → 점수순 매칭 결과 (최근 사용 순, 최대 _MAX_CACHED_SEARCHES개)
+        self._search_cache: "OrderedDict[str, List[TemplateInfo]]" = OrderedDict()
 
     def load_index(self) -> Dict:
         """템플릿 인덱스 로드
@@ -127,14 +212,47 @@ class TemplateLoader:
             인덱스 딕셔너리
         """
         if self._index is None:
-            index_path = self.templates_dir / "index.json"
-            if index_path.exists():
-                with open(index_path, 'r', encoding='utf-8') as f:
-                    self._index = json.load(f)
-            else:
-                self._index = {"templates": [], "categories": []}
+            # 백그라운드 미리 로드와 동시에 호출되어도 한 번만 파싱
+            with self._index_lock:
+                if self._index is None:
+                    index_path = self.templates_dir / "index.json"
+                    if index_path.exists():
+                        index = _read_json(index_path)
+                    else:
+                        index = {"templates": [], "categories": []}
+
+                    templates = index.get("templates", [])
+                    infos = [TemplateInfo.from_dict(t) for t in templates]
+                    info_by_id: Dict[str, TemplateInfo] = {}
+                    meta_by_id: Dict[str, Dict] = {}
+                    for t, info in zip(templates, infos):
+                        # ID가 중복되면 인덱스의 첫 항목 사용
+                        info_by_id.setdefault(info.id, info)
+                        meta_by_id.setdefault(info.id, t)
+
+                    self._infos = infos
+                    self._info_by_id = info_by_id
+                    self._meta_by_id = meta_by_id
+                    # 다른 스레드가 빈 조회 맵을 보지 않도록 인덱스는 마지막에 설정
+                    self._index = index
         return self._index
 
+    def preload_index(self) -> threading.Thread:
+        """백그라운드 스레드에서 인덱스 미리 로드
+
+        앱 시작 시 호출해 두면 첫 템플릿 조회가 디스크 I/O를 기다리지 않습니다.
+
+        Returns:
+            로드를 수행하는 데몬 스레드
+        """
+        thread = threading.Thread(
+            target=self.load_index,
+            name="TemplateIndexPreload",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
     def list_templates(
         self,
         category: Optional[str] = None,
@@ -151,43 +269,20 @@ class TemplateLoader:
         Returns:
             TemplateInfo 목록
         """
-        index = self.load_index()
-        templates = []
-
-        for t in index.get("templates", []):
-            # 카테고리 필터
-            if category and t.get("category") != category:
-                continue
-
-            # 태그 필터
-            if tags:
-                template_tags = t.get("tags", [])
-                if not any(tag in template_tags for tag in tags):
-                    continue
-
-            templates.append(TemplateInfo(
-                id=t["id"],
-                name=t["name"],
-                name_ko=t.get("name_ko", t["name"]),
-                category=t["category"],
-                description=t.get("description", ""),
-                tags=t.get("tags", []),
-                thumbnail_path=t.get("thumbnail", ""),
-                slides_count=t.get("slides_count", 10),
-                color_schemes=t.get("color_schemes", []),
-                best_for=t.get("best_for", []),
-                popularity=t.get("popularity", 0),
-                created_at=t.get("created_at", ""),
-                updated_at=t.get("updated_at", "")
-            ))
+        self.load_index()
+        tag_set = set(tags) if tags else None
+
+        # 캐시된 TemplateInfo에서 카테고리/태그 필터 적용
+        templates = [
+            info for info in self._infos
+            if (not category or info.category == category)
+            and (tag_set is None or not tag_set.isdisjoint(info.tags))
+        ]
 
         # 정렬
-        if sort_by == "popularity":
-            templates.sort(key=lambda x: x.popularity, reverse=True)
-        elif sort_by == "name":
-            templates.sort(key=lambda x: x.name)
-        elif sort_by == "created_at":
-            templates.sort(key=lambda x: x.created_at, reverse=True)
+        sort_key = _SORT_KEYS.get(sort_by)
+        if sort_key is not None:
+            templates.sort(key=sort_key, reverse=_SORT_REVERSE[sort_by])
 
         return templates
 
@@ -200,16 +295,14 @@ class TemplateLoader:
         Returns:
             템플릿 정의 딕셔너리 또는 None
         """
-        if template_id in self._templates:
-            return self._templates[template_id]
+        template_data = self._templates.get(template_id)
+        if template_data is not None:
+            self._templates.move_to_end(template_id)
+            return template_data
 
         # 인덱스에서 템플릿 찾기
-        index = self.load_index()
-        template_meta = None
-        for t in index.get("templates", []):
-            if t["id"] == template_id:
-                template_meta = t
-                break
+        self.load_index()
+        template_meta = self._meta_by_id.get(template_id)
 
         if not template_meta:
             return None
@@ -219,10 +312,11 @@ class TemplateLoader:
         template_path = self.templates_dir / category / template_id / "template.json"
 
         if template_path.exists():
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_data = json.load(f)
-                self._templates[template_id] = template_data
-                return template_data
+            template_data = _read_json(template_path)
+            self._templates[template_id] = template_data
+            if len(self._templates) > _MAX_CACHED_TEMPLATES:
+                self._templates.popitem(last=False)
+            return template_data
 
         return None
 
@@ -235,25 +329,8 @@ class TemplateLoader:
         Returns:
             TemplateInfo 또는 None
         """
-        index = self.load_index()
-        for t in index.get("templates", []):
-            if t["id"] == template_id:
-                return TemplateInfo(
-                    id=t["id"],
-                    name=t["name"],
-                    name_ko=t.get("name_ko", t["name"]),
-                    category=t["category"],
-                    description=t.get("description", ""),
-                    tags=t.get("tags", []),
-                    thumbnail_path=t.get("thumbnail", ""),
-                    slides_count=t.get("slides_count", 10),
-                    color_schemes=t.get("color_schemes", []),
-                    best_for=t.get("best_for", []),
-                    popularity=t.get("popularity", 0),
-                    created_at=t.get("created_at", ""),
-                    updated_at=t.get("updated_at", "")
-                )
-        return None
+        self.load_index()
+        return self._info_by_id.get(template_id)
 
     def get_categories(self) -> List[CategoryInfo]:
         """카테고리 목록 조회
@@ -333,18 +410,28 @@ class TemplateLoader:
         Returns:
             검색 결과 TemplateInfo 목록
         """
-        templates = self.list_templates()
-        scored_templates = []
+        # 점수는 소문자 검색어에만 의존하므로 소문자 검색어 기준으로 결과를 재사용
+        query_key = query.lower()
+        ranked = self._search_cache.get(query_key)
 
-        for t in templates:
-            score = t.matches_query(query)
-            if score > 0:
-                scored_templates.append((t, score))
+        if ranked is not None:
+            self._search_cache.move_to_end(query_key)
+        else:
+            scored_templates = []
+            for t in self.list_templates():
+                score = t.matches_query(query)
+                if score > 0:
+                    scored_templates.append((t, score))
+
+            # 점수순 정렬
+            scored_templates.sort(key=lambda x: x[1], reverse=True)
 
-        # 점수순 정렬
-        scored_templates.sort(key=lambda x: x[1], reverse=True)
+            ranked = [t for t, _ in scored_templates]
+            self._search_cache[query_key] = ranked
+            if len(self._search_cache) > _MAX_CACHED_SEARCHES:
+                self._search_cache.popitem(last=False)
 
-        return [t for t, _ in scored_templates[:limit]]
+        return ranked[:limit]
 
     def get_templates_by_purpose(self, purpose: str) -> List[TemplateInfo]:
         """목적에 맞는 템플릿 검색
@@ -373,9 +460,14 @@ class TemplateLoader:
 
     def reload_index(self) -> None:
         """인덱스 다시 로드"""
-        self._index = None
-        self._templates.clear()
-        self._categories.clear()
+        with self._index_lock:
+            self._index = None
+            self._templates.clear()
+            self._categories.clear()
+            self._infos = []
+            self._info_by_id = {}
+            self._meta_by_id = {}
+            self._search_cache.clear()
         self.load_index()
 
     def template_exists(self, template_id: str) -> bool:
@@ -387,11 +479,8 @@ class TemplateLoader:
         Returns:
             존재하면 True
         """
-        index = self.load_index()
-        for t in index.get("templates", []):
-            if t["id"] == template_id:
-                return True
-        return False
+        self.load_index()
+        return template_id in self._meta_by_id
 
     def get_color_schemes_for_template(self, template_id: str) -> List[str]:
         """템플릿에서 사용 가능한 색상 스키마 목록
@@ -402,17 +491,17 @@ class TemplateLoader:
         Returns:
             색상 스키마 이름 목록
         """
+        # 인덱스에 목록이 있으면 template.json을 열지 않음
+        info = self.get_template_info(template_id)
+        if info and info.color_schemes:
+            return list(info.color_schemes)
+
         template = self.get_template(template_id)
         if template:
             design = template.get("design", {})
             color_schemes = design.get("color_schemes", {})
             return list(color_schemes.keys())
 
-        # 인덱스에서 색상 스키마 목록 가져오기
-        info = self.get_template_info(template_id)
-        if info:
-            return info.color_schemes
-
         return []
 
     def get_recommended_slides(self, template_id: str) -> List[Dict]:
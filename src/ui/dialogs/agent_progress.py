@@ -1,8 +1,10 @@
 """Agent Progress Dialog for NanumSlide."""
 
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 from PySide6.QtWidgets import (
     QDialog,
@@ -31,7 +33,54 @@ class AgentStatus(Enum):
     WAITING = "waiting"
 
 
-@dataclass
+_STATUS_COLORS = {
+    AgentStatus.IDLE: "#9e9e9e",
+    AgentStatus.RUNNING: "#2196f3",
+    AgentStatus.COMPLETED: "#4caf50",
+    AgentStatus.ERROR: "#f44336",
+    AgentStatus.WAITING: "#ff9800",
+}
+
+_STATUS_TEXTS = {
+    AgentStatus.IDLE: "대기 중",
+    AgentStatus.RUNNING: "실행 중",
+    AgentStatus.COMPLETED: "완료",
+    AgentStatus.ERROR: "오류",
+    AgentStatus.WAITING: "대기",
+}
+
+# Stylesheets per status, built once instead of on every display update
+_INDICATOR_STYLES = {
+    status: f"background-color: {color}; border-radius: 6px;"
+    for status, color in _STATUS_COLORS.items()
+}
+_STATUS_LABEL_STYLES = {
+    status: f"color: {color};" for status, color in _STATUS_COLORS.items()
+}
+_CARD_STYLES = {
+    AgentStatus.RUNNING: "AgentCard { background-color: #e3f2fd; border-radius: 8px; }",
+    AgentStatus.COMPLETED: "AgentCard { background-color: #e8f5e9; border-radius: 8px; }",
+    AgentStatus.ERROR: "AgentCard { background-color: #ffebee; border-radius: 8px; }",
+}
+_DEFAULT_CARD_STYLE = "AgentCard { background-color: #fafafa; border-radius: 8px; }"
+
+_LOG_COLORS = {
+    "info": "#d4d4d4",
+    "success": "#4caf50",
+    "warning": "#ff9800",
+    "error": "#f44336",
+}
+
+
+@lru_cache(maxsize=None)
+def _font(family: str, point_size: int, bold: bool = False) -> QFont:
+    """Return a shared QFont, created on first use since QFont needs a QApplication."""
+    if bold:
+        return QFont(family, point_size, QFont.Bold)
+    return QFont(family, point_size)
+
+
+@dataclass(slots=True)
 class AgentState:
     """State of a single agent."""
     agent_id: str
@@ -40,11 +89,28 @@ class AgentState:
     status: AgentStatus = AgentStatus.IDLE
     progress: float = 0.0
     current_task: str = ""
-    messages: List[str] = field(default_factory=list)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    messages: Optional[List[str]] = None  # allocated on first add_message()
+    # Unix timestamps (time.time()); converted to datetime only for display
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
     error: Optional[str] = None
 
+    def add_message(self, message: str):
+        """Append a message, creating the list on first use."""
+        if self.messages is None:
+            self.messages = []
+        self.messages.append(message)
+
+    @property
+    def started_at_dt(self) -> Optional[datetime]:
+        """Start time as a local datetime."""
+        return None if self.started_at is None else datetime.fromtimestamp(self.started_at)
+
+    @property
+    def completed_at_dt(self) -> Optional[datetime]:
+        """Completion time as a local datetime."""
+        return None if self.completed_at is None else datetime.fromtimestamp(self.completed_at)
+
 
 class AgentCard(QFrame):
     """Card widget showing status of a single agent."""
@@ -56,6 +122,8 @@ class AgentCard(QFrame):
     ):
         super().__init__(parent)
         self.agent_state = agent_state
+        self._shown_status: Optional[AgentStatus] = None
+        self._last_display_key: Optional[Tuple[AgentStatus, int, str]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -76,14 +144,14 @@ class AgentCard(QFrame):
 
         # Agent name
         self.name_label = QLabel(self.agent_state.name_ko)
-        self.name_label.setFont(QFont("Pretendard", 11, QFont.Bold))
+        self.name_label.setFont(_font("Pretendard", 11, bold=True))
         header_layout.addWidget(self.name_label)
 
         header_layout.addStretch()
 
         # Status text
         self.status_label = QLabel()
-        self.status_label.setFont(QFont("Pretendard", 9))
+        self.status_label.setFont(_font("Pretendard", 9))
         header_layout.addWidget(self.status_label)
 
         layout.addLayout(header_layout)
@@ -91,7 +159,7 @@ class AgentCard(QFrame):
         # Current task
         self.task_label = QLabel()
         self.task_label.setStyleSheet("color: #666;")
-        self.task_label.setFont(QFont("Pretendard", 9))
+        self.task_label.setFont(_font("Pretendard", 9))
         self.task_label.setWordWrap(True)
         layout.addWidget(self.task_label)
 
@@ -119,50 +187,32 @@ class AgentCard(QFrame):
         self.update_display()
 
     def update_display(self):
-        status = self.agent_state.status
-
-        # Update status indicator color
-        colors = {
-            AgentStatus.IDLE: "#9e9e9e",
-            AgentStatus.RUNNING: "#2196f3",
-            AgentStatus.COMPLETED: "#4caf50",
-            AgentStatus.ERROR: "#f44336",
-            AgentStatus.WAITING: "#ff9800",
-        }
-        color = colors.get(status, "#9e9e9e")
-        self.status_indicator.setStyleSheet(
-            f"background-color: {color}; border-radius: 6px;"
-        )
-
-        # Update status text
-        status_texts = {
-            AgentStatus.IDLE: "대기 중",
-            AgentStatus.RUNNING: "실행 중",
-            AgentStatus.COMPLETED: "완료",
-            AgentStatus.ERROR: "오류",
-            AgentStatus.WAITING: "대기",
-        }
-        self.status_label.setText(status_texts.get(status, ""))
-        self.status_label.setStyleSheet(f"color: {color};")
+        state = self.agent_state
+        status = state.status
+
+        # Skip the widget updates entirely when nothing visible has changed
+        display_key = (status, int(state.progress * 100), state.current_task)
+        if display_key == self._last_display_key:
+            return
+        self._last_display_key = display_key
+
+        # Stylesheets only change with the status; re-applying them makes Qt re-parse
+        if status != self._shown_status:
+            self._shown_status = status
+            self.status_indicator.setStyleSheet(
+                _INDICATOR_STYLES.get(status, _INDICATOR_STYLES[AgentStatus.IDLE])
+            )
+            self.status_label.setText(_STATUS_TEXTS.get(status, ""))
+            self.status_label.setStyleSheet(
+                _STATUS_LABEL_STYLES.get(status, _STATUS_LABEL_STYLES[AgentStatus.IDLE])
+            )
+            self.setStyleSheet(_CARD_STYLES.get(status, _DEFAULT_CARD_STYLE))
 
         # Update task label
-        if self.agent_state.current_task:
-            self.task_label.setText(self.agent_state.current_task)
-        else:
-            self.task_label.setText("")
+        self.task_label.setText(state.current_task or "")
 
         # Update progress bar
-        self.progress_bar.setValue(int(self.agent_state.progress * 100))
-
-        # Update card style based on status
-        if status == AgentStatus.RUNNING:
-            self.setStyleSheet("AgentCard { background-color: #e3f2fd; border-radius: 8px; }")
-        elif status == AgentStatus.COMPLETED:
-            self.setStyleSheet("AgentCard { background-color: #e8f5e9; border-radius: 8px; }")
-        elif status == AgentStatus.ERROR:
-            self.setStyleSheet("AgentCard { background-color: #ffebee; border-radius: 8px; }")
-        else:
-            self.setStyleSheet("AgentCard { background-color: #fafafa; border-radius: 8px; }")
+        self.progress_bar.setValue(display_key[1])
 
 
 class AgentProgressDialog(QDialog):
@@ -177,8 +227,15 @@ class AgentProgressDialog(QDialog):
     ):
         super().__init__(parent)
         self.agent_cards: Dict[str, AgentCard] = {}
+        self._log_buffer: List[str] = []
         self._setup_ui(title)
 
+        # Log lines are buffered and appended together at most every 50 ms
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+
     def _setup_ui(self, title: str):
         self.setWindowTitle(title)
         self.setMinimumSize(600, 500)
@@ -189,7 +246,7 @@ class AgentProgressDialog(QDialog):
 
         # Header
         header_label = QLabel(title)
-        header_label.setFont(QFont("Pretendard", 14, QFont.Bold))
+        header_label.setFont(_font("Pretendard", 14, bold=True))
         layout.addWidget(header_label)
 
         # Overall progress
@@ -227,7 +284,7 @@ class AgentProgressDialog(QDialog):
         agents_layout.setContentsMargins(0, 0, 0, 0)
 
         agents_label = QLabel("에이전트 상태")
-        agents_label.setFont(QFont("Pretendard", 11, QFont.Bold))
+        agents_label.setFont(_font("Pretendard", 11, bold=True))
         agents_layout.addWidget(agents_label)
 
         scroll_area = QScrollArea()
@@ -250,13 +307,14 @@ class AgentProgressDialog(QDialog):
         log_layout.setContentsMargins(0, 0, 0, 0)
 
         log_label = QLabel("로그")
-        log_label.setFont(QFont("Pretendard", 11, QFont.Bold))
+        log_label.setFont(_font("Pretendard", 11, bold=True))
         log_layout.addWidget(log_label)
 
         self.log_output = QTextEdit()
         self.log_output.setReadOnly(True)
-        self.log_output.setFont(QFont("Consolas", 9))
+        self.log_output.setFont(_font("Consolas", 9))
         self.log_output.setStyleSheet("background-color: #1e1e1e; color: #d4d4d4;")
+        self._log_scrollbar = self.log_output.verticalScrollBar()
         log_layout.addWidget(self.log_output)
 
         splitter.addWidget(log_widget)
@@ -319,21 +377,24 @@ class AgentProgressDialog(QDialog):
 
     def add_log(self, message: str, level: str = "info"):
         """Add a log message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        colors = {
-            "info": "#d4d4d4",
-            "success": "#4caf50",
-            "warning": "#ff9800",
-            "error": "#f44336",
-        }
-        color = colors.get(level, "#d4d4d4")
+        timestamp = time.strftime("%H:%M:%S")
+        color = _LOG_COLORS.get(level, "#d4d4d4")
 
         html = f'<span style="color: #888;">[{timestamp}]</span> <span style="color: {color};">{message}</span>'
-        self.log_output.append(html)
+        self._log_buffer.append(html)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all buffered log messages in one update."""
+        if not self._log_buffer:
+            return
+
+        self.log_output.append("<br>".join(self._log_buffer))
+        self._log_buffer.clear()
 
-        # Auto-scroll to bottom
-        scrollbar = self.log_output.verticalScrollBar()
+        # Auto-scroll to bottom once per flush
+        scrollbar = self._log_scrollbar
         scrollbar.setValue(scrollbar.maximum())
 
     def set_completed(self, success: bool = True):
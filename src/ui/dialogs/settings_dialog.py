@@ -1,71 +1,372 @@
 """설정 다이얼로그"""
 
-import os
+import hashlib
 import json
+import os
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
-
+from types import MappingProxyType
+
+from PySide6.QtCore import (
+    QObject,
+    QRectF,
+    QRunnable,
+    QStringListModel,
+    Qt,
+    QThread,
+    QThreadPool,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
     QDialog,
-    QVBoxLayout,
+    QFormLayout,
+    QFrame,
+    QGridLayout,
+    QGroupBox,
     QHBoxLayout,
-    QTabWidget,
-    QWidget,
     QLabel,
     QLineEdit,
-    QComboBox,
-    QPushButton,
-    QGroupBox,
-    QFormLayout,
+    QListWidget,
+    QListWidgetItem,
     QMessageBox,
-    QCheckBox,
-    QApplication,
-    QFrame,
+    QPushButton,
     QScrollArea,
     QSlider,
     QSpinBox,
-    QGridLayout,
-    QListWidget,
-    QListWidgetItem,
     QSplitter,
+    QTabWidget,
     QTextEdit,
+    QVBoxLayout,
+    QWidget,
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QColor, QFont
 
-from src.config import LLMProvider, ImageProvider
-from src.services.llm_client import fetch_openai_models, fetch_anthropic_models
-from src.mcp.mcp_config import get_mcp_config_manager, MCPConfigManager
+from src.config import ImageProvider, LLMProvider
+from src.mcp.mcp_config import MCPConfigManager, get_mcp_config_manager
+from src.services import model_cache
+from src.services.llm_client import fetch_anthropic_models, fetch_openai_models
+
+# API 키 검증 결과 캐시: 키 해시 → (만료 시각, (성공여부, 메시지, 모델목록))
+# 실패 결과는 키 수정 후 재시도를 막지 않도록 짧게 보관
+_VALIDATION_TTL = 600.0
+_VALIDATION_FAILURE_TTL = 30.0
+_VALIDATION_CACHE_SIZE = 32
+_validation_cache: dict[str, tuple[float, tuple[bool, str, list]]] = {}
+_validation_failure_cache: dict[str, tuple[float, tuple[bool, str, list]]] = {}
+
+
+def _validation_cache_key(provider: str, api_key: str) -> str:
+    """API 키를 그대로 보관하지 않도록 해시한 캐시 키"""
+    return hashlib.sha256(f"{provider}:{api_key}".encode("utf-8")).hexdigest()
+
+
+def _get_cached_validation(provider: str, api_key: str) -> tuple[bool, str, list] | None:
+    """만료되지 않은 API 키 검증 결과 조회"""
+    key = _validation_cache_key(provider, api_key)
+    now = time.monotonic()
+    for cache in (_validation_cache, _validation_failure_cache):
+        entry = cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                return entry[1]
+            cache.pop(key, None)
+    return None
+
+
+def _store_validation(provider: str, api_key: str, result: tuple[bool, str, list]):
+    """API 키 검증 결과 저장"""
+    success = result[0]
+    cache = _validation_cache if success else _validation_failure_cache
+    ttl = _VALIDATION_TTL if success else _VALIDATION_FAILURE_TTL
+
+    key = _validation_cache_key(provider, api_key)
+    cache.pop(key, None)
+    cache[key] = (time.monotonic() + ttl, result)
+    # 가장 오래된 항목부터 제거
+    while len(cache) > _VALIDATION_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+
+
+# .env ↔ 위젯 대응표: (위젯 속성 이름, 환경 변수, 기본값)
+# LLM 프로바이더는 (프로바이더, .env 구역 주석, 필드) 단위로 묶음
+_LLM_ENV_SECTIONS = (
+    ("OpenAI", "# OpenAI", (
+        ("openai_api_key", "OPENAI_API_KEY", ""),
+        ("openai_model", "OPENAI_MODEL", ""),
+    )),
+    ("Google", "# Google Gemini", (
+        ("google_api_key", "GOOGLE_API_KEY", ""),
+        ("google_model", "GOOGLE_MODEL", ""),
+    )),
+    ("Anthropic", "# Anthropic Claude", (
+        ("anthropic_api_key", "ANTHROPIC_API_KEY", ""),
+        ("anthropic_model", "ANTHROPIC_MODEL", ""),
+    )),
+    ("Ollama", "# Ollama", (
+        ("ollama_url", "OLLAMA_URL", "http://localhost:11434"),
+        ("ollama_model", "OLLAMA_MODEL", ""),
+    )),
+)
+_IMAGE_ENV_FIELDS = (
+    ("pexels_api_key", "PEXELS_API_KEY", ""),
+    ("pixabay_api_key", "PIXABAY_API_KEY", ""),
+)
 
+# 설정 값 ↔ 콤보박스 표시 이름 (읽기 전용, 역방향은 저장 시 사용)
+_LLM_PROVIDER_TO_UI = MappingProxyType({
+    "openai": "OpenAI",
+    "google": "Google",
+    "anthropic": "Anthropic",
+    "ollama": "Ollama",
+})
+_IMAGE_PROVIDER_TO_UI = MappingProxyType({
+    "dall-e-3": "DALL-E (OpenAI)",
+    "pexels": "Pexels",
+    "pixabay": "Pixabay",
+    "disabled": "비활성화",
+})
+_SEARCH_PROVIDER_TO_UI = MappingProxyType({
+    "duckduckgo": "DuckDuckGo (무료)",
+    "google": "Google",
+    "bing": "Bing",
+})
+_IMAGE_GEN_PROVIDER_TO_UI = MappingProxyType({
+    "dalle3": "DALL-E 3",
+    "stable_diffusion": "Stable Diffusion",
+    "midjourney": "Midjourney API",
+})
+_UI_TO_LLM_PROVIDER = MappingProxyType({v: k for k, v in _LLM_PROVIDER_TO_UI.items()})
+_UI_TO_IMAGE_PROVIDER = MappingProxyType({v: k for k, v in _IMAGE_PROVIDER_TO_UI.items()})
+_UI_TO_SEARCH_PROVIDER = MappingProxyType({v: k for k, v in _SEARCH_PROVIDER_TO_UI.items()})
+_UI_TO_IMAGE_GEN_PROVIDER = MappingProxyType({v: k for k, v in _IMAGE_GEN_PROVIDER_TO_UI.items()})
+
+
+def _set_combo_items(combo: QComboBox, items: list[str]):
+    """콤보박스 항목을 한 번에 교체
+
+    문자열 목록 모델을 재사용해 setStringList 한 번(모델 리셋 알림 한 번)으로 교체하므로
+    항목마다 행 삽입 알림이나 아이템 객체 생성이 발생하지 않습니다.
+    """
+    model = combo.model()
+    if not isinstance(model, QStringListModel):
+        model = QStringListModel(combo)
+        combo.setModel(model)
+    model.setStringList(items)
+
+
+# .env의 KEY=VALUE 줄 (앞뒤 공백 제외, '#'으로 시작하는 주석 줄 제외)
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*+(?!#)([^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+# 파싱된 .env 캐시: 경로 → (수정 시각, 변수 딕셔너리)
+_env_cache: dict[str, tuple[int, dict[str, str]]] = {}
+
+
+def _read_env_file(env_path: Path) -> dict[str, str] | None:
+    """.env 파일 파싱 (수정 시각이 같으면 캐시 사용)
+
+    Returns:
+        변수 딕셔너리, 파일이 없으면 None
+    """
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cache_key = str(env_path)
+    cached = _env_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    env_vars = dict(_ENV_LINE_RE.findall(env_path.read_text(encoding="utf-8")))
+
+    _env_cache[cache_key] = (mtime_ns, env_vars)
+    return env_vars
+
+
+def _write_env_file(env_path: Path, content: str):
+    """.env 파일을 원자적으로 저장
+
+    임시 파일에 한 번에 쓴 뒤 교체하므로 저장 중 중단되어도 기존 파일이 깨지지 않습니다.
+    API 키가 들어 있으므로 기존 파일의 권한을 유지합니다.
+    """
+    tmp_path = env_path.with_name(env_path.name + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    try:
+        os.chmod(tmp_path, env_path.stat().st_mode & 0o777)
+    except FileNotFoundError:
+        pass
+    os.replace(tmp_path, env_path)
+    _env_cache.pop(str(env_path), None)
+
+
+class _EnvLoadSignals(QObject):
+    """EnvLoadWorker 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+    loaded = Signal(object)  # 변수 딕셔너리 또는 None
+
+
+class EnvLoadWorker(QRunnable):
+    """.env 파일을 백그라운드에서 읽는 작업"""
+
+    def __init__(self, env_path: Path):
+        super().__init__()
+        self.env_path = env_path
+        self.signals = _EnvLoadSignals()
 
-class ApiValidationWorker(QThread):
-    """API 키 검증 워커 스레드"""
-    finished = Signal(bool, str, list)  # (성공여부, 메시지, 모델목록)
+    def run(self):
+        try:
+            env_vars = _read_env_file(self.env_path)
+        except (OSError, UnicodeDecodeError):
+            env_vars = None
+        self.signals.loaded.emit(env_vars)
 
-    def __init__(self, provider: str, api_key: str):
+
+class _ApiValidationSignals(QObject):
+    """ApiValidationWorker 시그널"""
+    finished = Signal(str, bool, str, list)  # (프로바이더, 성공여부, 메시지, 모델목록)
+
+
+class ApiValidationWorker(QRunnable):
+    """API 키 검증 작업 (스레드 풀에서 실행)"""
+
+    def __init__(self, provider: str, api_key: str, use_disk_cache: bool = True):
         super().__init__()
         self.provider = provider
         self.api_key = api_key
+        self.use_disk_cache = use_disk_cache
+        self.signals = _ApiValidationSignals()
+        self.cancelled = False
 
     def run(self):
-        if self.provider == "openai":
-            success, message, models = fetch_openai_models(self.api_key)
-            self.finished.emit(success, message, models)
-        elif self.provider == "anthropic":
-            success, message, models = fetch_anthropic_models(self.api_key)
-            self.finished.emit(success, message, models)
+        if self.provider not in ("openai", "anthropic"):
+            self.signals.finished.emit(self.provider, False, "지원하지 않는 프로바이더", [])
+            return
+
+        # 디스크 모델 캐시 조회도 GUI 스레드가 아닌 여기서 수행
+        models = None
+        if self.use_disk_cache:
+            models = model_cache.get_models(self.provider, self.api_key)
+        if models is not None:
+            message = f"✓ 유효한 키입니다. {len(models)}개 모델 사용 가능 (캐시됨)"
+            result = (True, message, models)
         else:
-            self.finished.emit(False, "지원하지 않는 프로바이더", [])
+            if self.provider == "openai":
+                result = fetch_openai_models(self.api_key)
+            else:
+                result = fetch_anthropic_models(self.api_key)
+            if result[0]:
+                model_cache.put_models(self.provider, self.api_key, result[2])
+
+        _store_validation(self.provider, self.api_key, result)
+        # 새 검증으로 대체된 작업은 결과만 캐시에 남기고 UI에는 알리지 않음
+        if not self.cancelled:
+            self.signals.finished.emit(self.provider, *result)
+
+
+@lru_cache(maxsize=None)
+def _prefetch_pool() -> QThreadPool:
+    """미리 검증용 스레드 풀 (UI와 경쟁하지 않도록 낮은 우선순위 스레드 사용)"""
+    pool = QThreadPool()
+    pool.setMaxThreadCount(2)
+    pool.setThreadPriority(QThread.Priority.LowPriority)
+    return pool
+
+
+# 다이얼로그 공통 레이블 스타일 (레이블마다 같은 스타일시트를 파싱하지 않도록 objectName으로 지정)
+_DIALOG_STYLE = (
+    "QLabel#desc { color: gray; font-size: 11px; margin-left: 20px; }"
+    "QLabel#info { color: gray; margin-bottom: 10px; }"
+    "QLabel#hint { color: gray; font-size: 11px; }"
+)
+
+
+def _gradient_style(start: str, end: str) -> str:
+    """템플릿 미리보기 그라데이션 스타일시트"""
+    return (
+        f"background: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
+        f"stop:0 {start}, stop:1 {end}); border-radius: 8px;"
+    )
+
+
+def _color_swatch_pixmap(colors, device_pixel_ratio: float = 1.0,
+                         size: int = 40, spacing: int = 6) -> QPixmap:
+    """색상 견본을 한 장의 픽스맵으로 그림
+
+    견본마다 스타일시트를 가진 QFrame을 만드는 대신 하나의 QLabel에 표시합니다.
+    """
+    width = len(colors) * size + max(len(colors) - 1, 0) * spacing
+    pixmap = QPixmap(round(width * device_pixel_ratio), round(size * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(QPen(QColor("#ccc"), 1))
+    for i, color in enumerate(colors):
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(QRectF(i * (size + spacing) + 0.5, 0.5, size - 1, size - 1), 4, 4)
+    painter.end()
+    return pixmap
+
+
+# 템플릿 미리보기: 템플릿 이름 → (미리 만든 스타일시트, 설명)
+_TEMPLATE_PREVIEWS = MappingProxyType({
+    name: (_gradient_style(start, end), info)
+    for name, start, end, info in (
+        ("자동 선택", "#4a5568", "#718096",
+         "AI가 주제에 맞는 최적의 템플릿을 자동으로 선택합니다."),
+        ("Pitch Deck (투자 유치용)", "#1a365d", "#2c5282",
+         "스타트업 투자 유치를 위한 전문적인 피치덱 템플릿\n"
+         "권장 슬라이드: 12장 | 색상: professional, bold, tech"),
+        ("Quarterly Report (분기 보고서)", "#0f4c81", "#1e6eb8",
+         "분기별 실적 보고를 위한 깔끔한 비즈니스 템플릿\n"
+         "권장 슬라이드: 15장 | 색상: corporate, minimal"),
+        ("Lecture (강의 자료)", "#2d6a4f", "#40916c",
+         "교육 및 강의용 프레젠테이션 템플릿\n권장 슬라이드: 20장 | 색상: nature, ocean, minimal"),
+        ("Product Launch (제품 출시)", "#e63946", "#f72585",
+         "제품 출시 및 마케팅 발표용 템플릿\n권장 슬라이드: 12장 | 색상: bold, vibrant, modern"),
+        ("Clean Minimal (미니멀)", "#374151", "#4b5563",
+         "깔끔하고 단순한 미니멀 디자인 템플릿\n"
+         "권장 슬라이드: 10장 | 색상: monochrome, minimal, dark"),
+    )
+})
+
+
+# 검증 가능한 프로바이더의 위젯: (API 키, 상태 레이블, 검증 버튼, 모델, 캐시 새로고침)
+_ValidatedProviderWidgets = tuple[QLineEdit, QLabel, QPushButton, QComboBox, QCheckBox]
 
 
 class SettingsDialog(QDialog):
     """설정 다이얼로그"""
 
+    # 프로바이더 → 설정 그룹 생성 메서드
+    _PROVIDER_GROUP_BUILDERS = {
+        "OpenAI": "_build_openai_group",
+        "Google": "_build_google_group",
+        "Anthropic": "_build_anthropic_group",
+        "Ollama": "_build_ollama_group",
+    }
+
+    # 처음 열릴 때 생성하는 탭: (생성 메서드, 탭 이름)
+    _LAZY_TABS = (
+        ("_create_agent_tab", "에이전트"),
+        ("_create_template_tab", "템플릿"),
+        ("_create_mcp_tab", "MCP 연결"),
+        ("_create_image_tab", "이미지"),
+        ("_create_general_tab", "일반"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("설정")
         self.setMinimumSize(500, 600)
         self.resize(600, 700)
+        self.setStyleSheet(_DIALOG_STYLE)
 
+        self._env_vars: dict[str, str] | None = None
         self._setup_ui()
         self._load_settings()
 
@@ -74,41 +375,33 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # 탭 위젯
-        tab_widget = QTabWidget()
+        self.tab_widget = QTabWidget()
 
         # AI 설정 탭
         ai_tab = self._create_ai_tab()
-        tab_widget.addTab(ai_tab, "AI 설정")
-
-        # 에이전트 설정 탭
-        agent_tab = self._create_agent_tab()
-        tab_widget.addTab(agent_tab, "에이전트")
-
-        # 템플릿 설정 탭
-        template_tab = self._create_template_tab()
-        tab_widget.addTab(template_tab, "템플릿")
-
-        # MCP 설정 탭
-        mcp_tab = self._create_mcp_tab()
-        tab_widget.addTab(mcp_tab, "MCP 연결")
-
-        # 이미지 설정 탭
-        image_tab = self._create_image_tab()
-        tab_widget.addTab(image_tab, "이미지")
-
-        # 일반 설정 탭
-        general_tab = self._create_general_tab()
-        tab_widget.addTab(general_tab, "일반")
-
-        layout.addWidget(tab_widget)
+        self.tab_widget.addTab(ai_tab, "AI 설정")
+
+        # 나머지 탭은 빈 컨테이너만 두고 처음 선택될 때 내용 생성
+        self._tab_containers: dict[str, QWidget] = {}
+        self._tab_builders_by_index: dict[int, str] = {}
+        for builder_name, label in self._LAZY_TABS:
+            container = QWidget()
+            container_layout = QVBoxLayout(container)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+            index = self.tab_widget.addTab(container, label)
+            self._tab_containers[builder_name] = container
+            self._tab_builders_by_index[index] = builder_name
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+
+        layout.addWidget(self.tab_widget)
 
         # 버튼
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        save_btn = QPushButton("저장")
-        save_btn.clicked.connect(self._save_settings)
-        button_layout.addWidget(save_btn)
+        self.save_btn = QPushButton("저장")
+        self.save_btn.clicked.connect(self._save_settings)
+        button_layout.addWidget(self.save_btn)
 
         cancel_btn = QPushButton("취소")
         cancel_btn.clicked.connect(self.reject)
@@ -116,6 +409,30 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _on_tab_changed(self, index: int):
+        """탭 선택 시 아직 생성되지 않은 탭 내용 생성"""
+        builder_name = self._tab_builders_by_index.get(index)
+        if builder_name is not None:
+            self._ensure_tab(builder_name)
+
+    def _is_tab_built(self, builder_name: str) -> bool:
+        """지연 생성 탭의 내용이 생성되었는지 여부"""
+        return self._tab_containers[builder_name].layout().count() > 0
+
+    def _ensure_tab(self, builder_name: str):
+        """지연 생성 탭의 내용을 한 번만 생성
+
+        다이얼로그가 이미 표시된 상태에서 생성되므로, 위젯을 추가하는 동안 화면 갱신을 멈춥니다.
+        """
+        if self._is_tab_built(builder_name):
+            return
+        container = self._tab_containers[builder_name]
+        container.setUpdatesEnabled(False)
+        try:
+            container.layout().addWidget(getattr(self, builder_name)())
+        finally:
+            container.setUpdatesEnabled(True)
+
     def _create_ai_tab(self) -> QWidget:
         """AI 설정 탭 생성"""
         widget = QWidget()
@@ -128,47 +445,112 @@ class SettingsDialog(QDialog):
         self.provider_combo = QComboBox()
         self.provider_combo.addItems(["OpenAI", "Google", "Anthropic", "Ollama"])
         self.provider_combo.currentTextChanged.connect(self._on_provider_changed)
-        provider_layout.addRow("프로바이더:", self.provider_combo)
+        provider_row = QHBoxLayout()
+        provider_row.addWidget(self.provider_combo, 1)
+        validate_all_btn = QPushButton("모두 검증")
+        validate_all_btn.setToolTip("입력된 모든 API 키를 동시에 검증합니다.")
+        validate_all_btn.clicked.connect(self._validate_all_keys)
+        provider_row.addWidget(validate_all_btn)
+        provider_layout.addRow("프로바이더:", provider_row)
 
         layout.addWidget(provider_group)
 
-        # OpenAI 설정
-        self.openai_group = QGroupBox("OpenAI 설정")
-        openai_layout = QVBoxLayout(self.openai_group)
+        # 프로바이더별 설정 그룹은 처음 선택될 때 생성
+        self._provider_groups: dict[str, QGroupBox] = {}
+        # 검증 가능한 프로바이더 위젯: 프로바이더 → _ValidatedProviderWidgets
+        self._validated_providers: dict[str, _ValidatedProviderWidgets] = {}
+        self._provider_groups_layout = QVBoxLayout()
+        self._provider_groups_layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(self._provider_groups_layout)
+        self._on_provider_changed(self.provider_combo.currentText())
+
+        layout.addStretch()
+
+        # 프로바이더별 최근 검증 작업 (새 검증으로 대체될 때 이전 결과를 버리기 위해 보관)
+        self._validation_workers: dict[str, ApiValidationWorker] = {}
+
+        return widget
+
+    def _ensure_provider_group(self, provider: str) -> QGroupBox | None:
+        """프로바이더 설정 그룹 반환 (없으면 생성)"""
+        group = self._provider_groups.get(provider)
+        if group is None:
+            builder_name = self._PROVIDER_GROUP_BUILDERS.get(provider)
+            if builder_name is None:
+                return None
+            group = getattr(self, builder_name)()
+            group.hide()
+            self._provider_groups_layout.addWidget(group)
+            self._provider_groups[provider] = group
+        return group
+
+    def _build_validated_provider_group(
+        self,
+        provider: str,
+        title: str,
+        placeholder: str
+    ) -> QGroupBox:
+        """API 키 검증을 지원하는 프로바이더 설정 그룹 생성
+
+        위젯은 `{provider}_api_key`, `{provider}_model` 등의 속성으로도 노출합니다.
+
+        Args:
+            provider: 검증 워커에 넘기는 프로바이더 이름 (openai, anthropic)
+            title: 그룹 제목
+            placeholder: API 키 입력란 안내 문구
+        """
+        group = QGroupBox(title)
+        group_layout = QVBoxLayout(group)
 
         # API 키 입력 행
-        openai_key_layout = QHBoxLayout()
-        openai_key_layout.addWidget(QLabel("API 키:"))
-        self.openai_api_key = QLineEdit()
-        self.openai_api_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self.openai_api_key.setPlaceholderText("sk-...")
-        openai_key_layout.addWidget(self.openai_api_key)
-        self.openai_validate_btn = QPushButton("검증")
-        self.openai_validate_btn.setFixedWidth(60)
-        self.openai_validate_btn.clicked.connect(self._validate_openai_key)
-        openai_key_layout.addWidget(self.openai_validate_btn)
-        openai_layout.addLayout(openai_key_layout)
+        key_layout = QHBoxLayout()
+        key_layout.addWidget(QLabel("API 키:"))
+        api_key_edit = QLineEdit()
+        api_key_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        api_key_edit.setPlaceholderText(placeholder)
+        key_layout.addWidget(api_key_edit)
+        validate_btn = QPushButton("검증")
+        validate_btn.setFixedWidth(60)
+        validate_btn.clicked.connect(lambda: self._validate_key(provider))
+        key_layout.addWidget(validate_btn)
+        refresh_check = QCheckBox("캐시 새로고침")
+        refresh_check.setToolTip("저장된 검증 결과를 무시하고 다시 검증합니다.")
+        key_layout.addWidget(refresh_check)
+        group_layout.addLayout(key_layout)
 
         # 검증 상태 레이블
-        self.openai_status_label = QLabel("")
-        self.openai_status_label.setWordWrap(True)
-        openai_layout.addWidget(self.openai_status_label)
+        status_label = QLabel("")
+        status_label.setWordWrap(True)
+        group_layout.addWidget(status_label)
 
         # 모델 선택
-        openai_model_layout = QHBoxLayout()
-        openai_model_layout.addWidget(QLabel("모델:"))
-        self.openai_model = QComboBox()
-        self.openai_model.setEditable(True)
-        self.openai_model.setMinimumWidth(250)
-        openai_model_layout.addWidget(self.openai_model)
-        openai_model_layout.addStretch()
-        openai_layout.addLayout(openai_model_layout)
+        model_layout = QHBoxLayout()
+        model_layout.addWidget(QLabel("모델:"))
+        model_combo = QComboBox()
+        model_combo.setEditable(True)
+        model_combo.setMinimumWidth(250)
+        model_layout.addWidget(model_combo)
+        model_layout.addStretch()
+        group_layout.addLayout(model_layout)
+
+        self._validated_providers[provider] = (
+            api_key_edit, status_label, validate_btn, model_combo, refresh_check
+        )
+        setattr(self, f"{provider}_api_key", api_key_edit)
+        setattr(self, f"{provider}_status_label", status_label)
+        setattr(self, f"{provider}_validate_btn", validate_btn)
+        setattr(self, f"{provider}_model", model_combo)
 
-        layout.addWidget(self.openai_group)
+        return group
 
-        # Google 설정
-        self.google_group = QGroupBox("Google Gemini 설정")
-        google_layout = QFormLayout(self.google_group)
+    def _build_openai_group(self) -> QGroupBox:
+        """OpenAI 설정 그룹 생성"""
+        return self._build_validated_provider_group("openai", "OpenAI 설정", "sk-...")
+
+    def _build_google_group(self) -> QGroupBox:
+        """Google Gemini 설정 그룹 생성"""
+        group = QGroupBox("Google Gemini 설정")
+        google_layout = QFormLayout(group)
 
         self.google_api_key = QLineEdit()
         self.google_api_key.setEchoMode(QLineEdit.EchoMode.Password)
@@ -179,47 +561,18 @@ class SettingsDialog(QDialog):
         self.google_model.setEditable(True)
         google_layout.addRow("모델:", self.google_model)
 
-        self.google_group.hide()
-        layout.addWidget(self.google_group)
-
-        # Anthropic 설정
-        self.anthropic_group = QGroupBox("Anthropic Claude 설정")
-        anthropic_layout = QVBoxLayout(self.anthropic_group)
-
-        # API 키 입력 행
-        anthropic_key_layout = QHBoxLayout()
-        anthropic_key_layout.addWidget(QLabel("API 키:"))
-        self.anthropic_api_key = QLineEdit()
-        self.anthropic_api_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self.anthropic_api_key.setPlaceholderText("sk-ant-...")
-        anthropic_key_layout.addWidget(self.anthropic_api_key)
-        self.anthropic_validate_btn = QPushButton("검증")
-        self.anthropic_validate_btn.setFixedWidth(60)
-        self.anthropic_validate_btn.clicked.connect(self._validate_anthropic_key)
-        anthropic_key_layout.addWidget(self.anthropic_validate_btn)
-        anthropic_layout.addLayout(anthropic_key_layout)
+        return group
 
-        # 검증 상태 레이블
-        self.anthropic_status_label = QLabel("")
-        self.anthropic_status_label.setWordWrap(True)
-        anthropic_layout.addWidget(self.anthropic_status_label)
+    def _build_anthropic_group(self) -> QGroupBox:
+        """Anthropic Claude 설정 그룹 생성"""
+        return self._build_validated_provider_group(
+            "anthropic", "Anthropic Claude 설정", "sk-ant-..."
+        )
 
-        # 모델 선택
-        anthropic_model_layout = QHBoxLayout()
-        anthropic_model_layout.addWidget(QLabel("모델:"))
-        self.anthropic_model = QComboBox()
-        self.anthropic_model.setEditable(True)
-        self.anthropic_model.setMinimumWidth(250)
-        anthropic_model_layout.addWidget(self.anthropic_model)
-        anthropic_model_layout.addStretch()
-        anthropic_layout.addLayout(anthropic_model_layout)
-
-        self.anthropic_group.hide()
-        layout.addWidget(self.anthropic_group)
-
-        # Ollama 설정
-        self.ollama_group = QGroupBox("Ollama 설정 (로컬 AI)")
-        ollama_layout = QFormLayout(self.ollama_group)
+    def _build_ollama_group(self) -> QGroupBox:
+        """Ollama 설정 그룹 생성"""
+        group = QGroupBox("Ollama 설정 (로컬 AI)")
+        ollama_layout = QFormLayout(group)
 
         self.ollama_url = QLineEdit()
         self.ollama_url.setPlaceholderText("http://localhost:11434")
@@ -230,87 +583,78 @@ class SettingsDialog(QDialog):
         self.ollama_model.setEditable(True)
         ollama_layout.addRow("모델:", self.ollama_model)
 
-        self.ollama_group.hide()
-        layout.addWidget(self.ollama_group)
+        return group
 
-        layout.addStretch()
-
-        # 검증 워커 참조 초기화
-        self.validation_worker = None
+    def _start_validation_worker(self, provider: str, api_key: str, use_disk_cache: bool = True):
+        """프로바이더 검증 작업을 스레드 풀에 제출
 
-        return widget
+        같은 프로바이더의 이전 작업 결과는 버리도록 연결을 끊습니다.
+        다른 프로바이더의 작업은 그대로 두므로 동시에 검증해도 서로의 결과를 잃지 않습니다.
+        """
+        previous = self._validation_workers.pop(provider, None)
+        if previous is not None:
+            previous.cancelled = True
+            previous.signals.finished.disconnect(self._on_validation_done)
 
-    def _validate_openai_key(self):
-        """OpenAI API 키 검증"""
-        api_key = self.openai_api_key.text().strip()
+        worker = ApiValidationWorker(provider, api_key, use_disk_cache)
+        worker.signals.finished.connect(
+            self._on_validation_done, Qt.ConnectionType.QueuedConnection
+        )
+        self._validation_workers[provider] = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _validate_key(self, provider: str):
+        """프로바이더 API 키 검증"""
+        widgets = self._validated_providers[provider]
+        api_key_edit, status_label, validate_btn, _, refresh_check = widgets
+        api_key = api_key_edit.text().strip()
         if not api_key:
-            self.openai_status_label.setText("API 키를 입력하세요.")
-            self.openai_status_label.setStyleSheet("color: orange;")
+            status_label.setText("API 키를 입력하세요.")
+            status_label.setStyleSheet("color: orange;")
             return
 
-        self.openai_validate_btn.setEnabled(False)
-        self.openai_status_label.setText("검증 중...")
-        self.openai_status_label.setStyleSheet("color: gray;")
-        QApplication.processEvents()
+        # 같은 키의 최근 검증 결과가 메모리에 있으면 작업 없이 바로 사용
+        # (디스크 캐시는 작업 스레드에서 조회)
+        use_cache = not refresh_check.isChecked()
+        if use_cache:
+            cached = _get_cached_validation(provider, api_key)
+            if cached is not None:
+                self._on_validation_done(provider, *cached)
+                return
 
-        self.validation_worker = ApiValidationWorker("openai", api_key)
-        self.validation_worker.finished.connect(self._on_openai_validation_done)
-        self.validation_worker.start()
+        validate_btn.setEnabled(False)
+        status_label.setText("검증 중...")
+        status_label.setStyleSheet("color: gray;")
 
-    def _on_openai_validation_done(self, success: bool, message: str, models: list):
-        """OpenAI 검증 완료 처리"""
-        self.openai_validate_btn.setEnabled(True)
-        self.openai_status_label.setText(message)
+        self._start_validation_worker(provider, api_key, use_disk_cache=use_cache)
 
-        if success:
-            self.openai_status_label.setStyleSheet("color: green;")
-            # 모델 목록 업데이트 (최신순)
-            current_model = self.openai_model.currentText()
-            self.openai_model.clear()
-            self.openai_model.addItems(models)
-            # 기존 선택 복원 또는 첫 번째 모델 선택
-            if current_model in models:
-                self.openai_model.setCurrentText(current_model)
-            elif models:
-                self.openai_model.setCurrentIndex(0)
-        else:
-            self.openai_status_label.setStyleSheet("color: red;")
-
-    def _validate_anthropic_key(self):
-        """Anthropic API 키 검증"""
-        api_key = self.anthropic_api_key.text().strip()
-        if not api_key:
-            self.anthropic_status_label.setText("API 키를 입력하세요.")
-            self.anthropic_status_label.setStyleSheet("color: orange;")
-            return
+    def _validate_all_keys(self):
+        """입력된 모든 API 키 검증
 
-        self.anthropic_validate_btn.setEnabled(False)
-        self.anthropic_status_label.setText("검증 중...")
-        self.anthropic_status_label.setStyleSheet("color: gray;")
-        QApplication.processEvents()
+        프로바이더마다 별도 워커로 동시에 요청하므로 전체 대기 시간은 가장 느린 응답에 맞춰집니다.
+        """
+        for provider, (api_key_edit, *_) in self._validated_providers.items():
+            if api_key_edit.text().strip():
+                self._validate_key(provider)
 
-        self.validation_worker = ApiValidationWorker("anthropic", api_key)
-        self.validation_worker.finished.connect(self._on_anthropic_validation_done)
-        self.validation_worker.start()
-
-    def _on_anthropic_validation_done(self, success: bool, message: str, models: list):
-        """Anthropic 검증 완료 처리"""
-        self.anthropic_validate_btn.setEnabled(True)
-        self.anthropic_status_label.setText(message)
+    def _on_validation_done(self, provider: str, success: bool, message: str, models: list):
+        """프로바이더 검증 완료 처리"""
+        _, status_label, validate_btn, model_combo, _ = self._validated_providers[provider]
+        validate_btn.setEnabled(True)
+        status_label.setText(message)
 
         if success:
-            self.anthropic_status_label.setStyleSheet("color: green;")
+            status_label.setStyleSheet("color: green;")
             # 모델 목록 업데이트 (최신순)
-            current_model = self.anthropic_model.currentText()
-            self.anthropic_model.clear()
-            self.anthropic_model.addItems(models)
+            current_model = model_combo.currentText()
+            _set_combo_items(model_combo, models)
             # 기존 선택 복원 또는 첫 번째 모델 선택
             if current_model in models:
-                self.anthropic_model.setCurrentText(current_model)
+                model_combo.setCurrentText(current_model)
             elif models:
-                self.anthropic_model.setCurrentIndex(0)
+                model_combo.setCurrentIndex(0)
         else:
-            self.anthropic_status_label.setStyleSheet("color: red;")
+            status_label.setStyleSheet("color: red;")
 
     def _create_image_tab(self) -> QWidget:
         """이미지 설정 탭 생성"""
@@ -327,7 +671,7 @@ class SettingsDialog(QDialog):
 
         # DALL-E 설명
         dalle_info = QLabel("DALL-E는 OpenAI API 키를 사용합니다. AI 설정 탭에서 OpenAI API 키를 설정하세요.")
-        dalle_info.setStyleSheet("color: gray; font-size: 11px;")
+        dalle_info.setObjectName("hint")
         dalle_info.setWordWrap(True)
         provider_layout.addRow("", dalle_info)
 
@@ -355,6 +699,10 @@ class SettingsDialog(QDialog):
 
         layout.addStretch()
 
+        # .env가 먼저 로드된 경우 값 반영
+        if self._env_vars is not None:
+            self._apply_image_env(self._env_vars)
+
         return widget
 
     def _create_general_tab(self) -> QWidget:
@@ -398,7 +746,7 @@ class SettingsDialog(QDialog):
             "각 에이전트를 활성화/비활성화하고 역할을 조정할 수 있습니다."
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: gray; margin-bottom: 10px;")
+        info_label.setObjectName("info")
         layout.addWidget(info_label)
 
         # 에이전트 목록
@@ -412,7 +760,7 @@ class SettingsDialog(QDialog):
         agents_layout.addWidget(self.research_agent_check)
 
         research_desc = QLabel("  └ 웹 검색, 자료 수집, 키워드 추출")
-        research_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        research_desc.setObjectName("desc")
         agents_layout.addWidget(research_desc)
 
         # Content Agent
@@ -422,7 +770,7 @@ class SettingsDialog(QDialog):
         agents_layout.addWidget(self.content_agent_check)
 
         content_desc = QLabel("  └ 슬라이드 구조화, 텍스트 작성, 스토리 구성")
-        content_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        content_desc.setObjectName("desc")
         agents_layout.addWidget(content_desc)
 
         # Design Agent
@@ -432,7 +780,7 @@ class SettingsDialog(QDialog):
         agents_layout.addWidget(self.design_agent_check)
 
         design_desc = QLabel("  └ 레이아웃 선택, 색상 배치, 시각적 구성")
-        design_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        design_desc.setObjectName("desc")
         agents_layout.addWidget(design_desc)
 
         # Image Agent
@@ -442,7 +790,7 @@ class SettingsDialog(QDialog):
         agents_layout.addWidget(self.image_agent_check)
 
         image_desc = QLabel("  └ 이미지 검색, AI 이미지 생성, 아이콘 선택")
-        image_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        image_desc.setObjectName("desc")
         agents_layout.addWidget(image_desc)
 
         # Review Agent
@@ -452,7 +800,7 @@ class SettingsDialog(QDialog):
         agents_layout.addWidget(self.review_agent_check)
 
         review_desc = QLabel("  └ 품질 검토, 일관성 확인, 개선 제안")
-        review_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        review_desc.setObjectName("desc")
         agents_layout.addWidget(review_desc)
 
         layout.addWidget(agents_group)
@@ -491,7 +839,7 @@ class SettingsDialog(QDialog):
         info_label = QLabel(
             "프레젠테이션 템플릿을 선택하고 기본값을 설정합니다."
         )
-        info_label.setStyleSheet("color: gray; margin-bottom: 10px;")
+        info_label.setObjectName("info")
         layout.addWidget(info_label)
 
         # 템플릿 설정
@@ -518,17 +866,14 @@ class SettingsDialog(QDialog):
 
         self.template_preview_frame = QFrame()
         self.template_preview_frame.setFixedHeight(120)
-        self.template_preview_frame.setStyleSheet(
-            "background: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
-            "stop:0 #1a365d, stop:1 #2c5282); border-radius: 8px;"
-        )
+        self.template_preview_frame.setStyleSheet(_TEMPLATE_PREVIEWS["Pitch Deck (투자 유치용)"][0])
         preview_layout.addWidget(self.template_preview_frame)
 
         self.template_info_label = QLabel(
             "Pitch Deck: 스타트업 투자 유치를 위한 전문적인 피치덱 템플릿\n"
             "권장 슬라이드: 12장 | 색상 테마: professional, bold, tech"
         )
-        self.template_info_label.setStyleSheet("font-size: 11px; color: gray;")
+        self.template_info_label.setObjectName("hint")
         self.template_info_label.setWordWrap(True)
         preview_layout.addWidget(self.template_info_label)
 
@@ -550,13 +895,12 @@ class SettingsDialog(QDialog):
 
         # 색상 미리보기
         color_preview_layout = QHBoxLayout()
-        self.color_previews = []
-        for color in ["#1a365d", "#2c5282", "#3182ce", "#ffffff", "#1a202c"]:
-            preview = QFrame()
-            preview.setFixedSize(40, 40)
-            preview.setStyleSheet(f"background-color: {color}; border-radius: 4px; border: 1px solid #ccc;")
-            color_preview_layout.addWidget(preview)
-            self.color_previews.append(preview)
+        self.color_preview_label = QLabel()
+        self.color_preview_label.setPixmap(_color_swatch_pixmap(
+            ("#1a365d", "#2c5282", "#3182ce", "#ffffff", "#1a202c"),
+            self.devicePixelRatioF(),
+        ))
+        color_preview_layout.addWidget(self.color_preview_label)
         color_preview_layout.addStretch()
         color_layout.addLayout(color_preview_layout)
 
@@ -579,7 +923,7 @@ class SettingsDialog(QDialog):
             "PowerPoint 고급 기능, 웹 검색 등을 사용할 수 있습니다."
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: gray; margin-bottom: 10px;")
+        info_label.setObjectName("info")
         layout.addWidget(info_label)
 
         # PowerPoint MCP
@@ -592,7 +936,7 @@ class SettingsDialog(QDialog):
         pptx_layout.addWidget(self.pptx_mcp_check)
 
         pptx_desc = QLabel("  └ 차트 생성, SmartArt, 애니메이션, 전환 효과")
-        pptx_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        pptx_desc.setObjectName("desc")
         pptx_layout.addWidget(pptx_desc)
 
         layout.addWidget(pptx_group)
@@ -607,7 +951,7 @@ class SettingsDialog(QDialog):
         search_layout.addWidget(self.search_mcp_check)
 
         search_desc = QLabel("  └ DuckDuckGo 무료 검색 지원")
-        search_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        search_desc.setObjectName("desc")
         search_layout.addWidget(search_desc)
 
         # 검색 엔진 선택
@@ -631,7 +975,7 @@ class SettingsDialog(QDialog):
         image_layout.addWidget(self.image_mcp_check)
 
         image_desc = QLabel("  └ DALL-E 3, Stable Diffusion 지원")
-        image_desc.setStyleSheet("color: gray; font-size: 11px; margin-left: 20px;")
+        image_desc.setObjectName("desc")
         image_layout.addWidget(image_desc)
 
         # 이미지 생성기 선택
@@ -667,112 +1011,112 @@ class SettingsDialog(QDialog):
         self.search_api_key_input = QLineEdit()
         self.mcp_server_url = QLineEdit()
 
+        self._load_mcp_settings()
+
         return widget
 
 
     def _on_template_changed(self, template_name: str):
         """템플릿 변경 시 미리보기 업데이트"""
-        templates_info = {
-            "자동 선택": {
-                "gradient": "#4a5568, #718096",
-                "info": "AI가 주제에 맞는 최적의 템플릿을 자동으로 선택합니다."
-            },
-            "Pitch Deck (투자 유치용)": {
-                "gradient": "#1a365d, #2c5282",
-                "info": "스타트업 투자 유치를 위한 전문적인 피치덱 템플릿\n권장 슬라이드: 12장 | 색상: professional, bold, tech"
-            },
-            "Quarterly Report (분기 보고서)": {
-                "gradient": "#0f4c81, #1e6eb8",
-                "info": "분기별 실적 보고를 위한 깔끔한 비즈니스 템플릿\n권장 슬라이드: 15장 | 색상: corporate, minimal"
-            },
-            "Lecture (강의 자료)": {
-                "gradient": "#2d6a4f, #40916c",
-                "info": "교육 및 강의용 프레젠테이션 템플릿\n권장 슬라이드: 20장 | 색상: nature, ocean, minimal"
-            },
-            "Product Launch (제품 출시)": {
-                "gradient": "#e63946, #f72585",
-                "info": "제품 출시 및 마케팅 발표용 템플릿\n권장 슬라이드: 12장 | 색상: bold, vibrant, modern"
-            },
-            "Clean Minimal (미니멀)": {
-                "gradient": "#374151, #4b5563",
-                "info": "깔끔하고 단순한 미니멀 디자인 템플릿\n권장 슬라이드: 10장 | 색상: monochrome, minimal, dark"
-            }
-        }
-
-        info = templates_info.get(template_name, templates_info["자동 선택"])
-        self.template_preview_frame.setStyleSheet(
-            f"background: qlineargradient(x1:0, y1:0, x2:1, y2:1, "
-            f"stop:0 {info['gradient'].split(', ')[0]}, stop:1 {info['gradient'].split(', ')[1]}); "
-            f"border-radius: 8px;"
-        )
-        self.template_info_label.setText(info["info"])
+        style, info = _TEMPLATE_PREVIEWS.get(template_name, _TEMPLATE_PREVIEWS["자동 선택"])
+        self.template_preview_frame.setStyleSheet(style)
+        self.template_info_label.setText(info)
 
 
     def _on_provider_changed(self, provider: str):
         """프로바이더 변경 처리"""
-        self.openai_group.hide()
-        self.google_group.hide()
-        self.anthropic_group.hide()
-        self.ollama_group.hide()
-
-        if provider == "OpenAI":
-            self.openai_group.show()
-        elif provider == "Google":
-            self.google_group.show()
-        elif provider == "Anthropic":
-            self.anthropic_group.show()
-        elif provider == "Ollama":
-            self.ollama_group.show()
+        for group in self._provider_groups.values():
+            group.hide()
+
+        group = self._ensure_provider_group(provider)
+        if group is not None:
+            group.show()
 
     def _load_settings(self):
-        """설정 로드"""
-        env_path = Path(".env")
-        if not env_path.exists():
+        """설정 로드
+
+        .env 파일 읽기는 스레드 풀에서 수행하고, 결과는 GUI 스레드에서 위젯에 반영합니다.
+        로드가 끝나기 전에 입력한 값이 덮어쓰이거나 빈 값으로 저장되지 않도록
+        탭과 저장 버튼을 잠시 비활성화합니다.
+        """
+        self.tab_widget.setEnabled(False)
+        self.save_btn.setEnabled(False)
+
+        worker = EnvLoadWorker(Path(".env"))
+        worker.signals.loaded.connect(self._apply_env_vars, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_env_vars(self, env_vars: dict[str, str] | None):
+        """로드된 .env 변수를 위젯에 반영"""
+        self.tab_widget.setEnabled(True)
+        self.save_btn.setEnabled(True)
+        if env_vars is None:
             return
-
-        env_vars = {}
-        with open(env_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    env_vars[key.strip()] = value.strip()
+        self._env_vars = env_vars
 
         # LLM 프로바이더
         provider = env_vars.get("LLM_PROVIDER", "openai").lower()
-        provider_map = {"openai": "OpenAI", "google": "Google", "anthropic": "Anthropic", "ollama": "Ollama"}
-        self.provider_combo.setCurrentText(provider_map.get(provider, "OpenAI"))
-
-        # OpenAI
-        self.openai_api_key.setText(env_vars.get("OPENAI_API_KEY", ""))
-        if "OPENAI_MODEL" in env_vars:
-            self.openai_model.setCurrentText(env_vars["OPENAI_MODEL"])
+        self.provider_combo.setCurrentText(_LLM_PROVIDER_TO_UI.get(provider, "OpenAI"))
 
-        # Google
-        self.google_api_key.setText(env_vars.get("GOOGLE_API_KEY", ""))
-        if "GOOGLE_MODEL" in env_vars:
-            self.google_model.setCurrentText(env_vars["GOOGLE_MODEL"])
+        # 값이 있는 프로바이더의 그룹만 생성해 채움 (나머지는 기본값 그대로)
+        for provider, _, fields in _LLM_ENV_SECTIONS:
+            if any(env_key in env_vars for _, env_key, _ in fields):
+                self._ensure_provider_group(provider)
+                self._apply_env_fields(fields, env_vars)
 
-        # Anthropic
-        self.anthropic_api_key.setText(env_vars.get("ANTHROPIC_API_KEY", ""))
-        if "ANTHROPIC_MODEL" in env_vars:
-            self.anthropic_model.setCurrentText(env_vars["ANTHROPIC_MODEL"])
+        # 이미지 탭이 이미 생성된 경우에만 반영 (아니면 탭 생성 시 반영)
+        if self._is_tab_built("_create_image_tab"):
+            self._apply_image_env(env_vars)
 
-        # Ollama
-        self.ollama_url.setText(env_vars.get("OLLAMA_URL", "http://localhost:11434"))
-        if "OLLAMA_MODEL" in env_vars:
-            self.ollama_model.setCurrentText(env_vars["OLLAMA_MODEL"])
+        self._prefetch_validations()
 
-        # 이미지 프로바이더
+    def _apply_image_env(self, env_vars: dict[str, str]):
+        """이미지 탭에 .env 변수 반영"""
         image_provider = env_vars.get("IMAGE_PROVIDER", "dall-e-3").lower()
-        image_map = {"dall-e-3": "DALL-E (OpenAI)", "pexels": "Pexels", "pixabay": "Pixabay", "disabled": "비활성화"}
-        self.image_provider_combo.setCurrentText(image_map.get(image_provider, "DALL-E (OpenAI)"))
-
-        self.pexels_api_key.setText(env_vars.get("PEXELS_API_KEY", ""))
-        self.pixabay_api_key.setText(env_vars.get("PIXABAY_API_KEY", ""))
-
-        # MCP 설정 로드
-        self._load_mcp_settings()
+        image_label = _IMAGE_PROVIDER_TO_UI.get(image_provider, "DALL-E (OpenAI)")
+        self.image_provider_combo.setCurrentText(image_label)
+
+        self._apply_env_fields(_IMAGE_ENV_FIELDS, env_vars)
+
+    def _prefetch_validations(self):
+        """저장된 API 키를 백그라운드에서 미리 검증
+
+        결과는 검증 캐시에만 저장되므로, 사용자가 검증 버튼을 누르면 바로 표시됩니다.
+        """
+        for provider, (api_key_edit, *_) in self._validated_providers.items():
+            api_key = api_key_edit.text().strip()
+            if not api_key or _get_cached_validation(provider, api_key) is not None:
+                continue
+            _prefetch_pool().start(ApiValidationWorker(provider, api_key))
+
+    def _apply_env_fields(self, fields, env_vars: dict[str, str]):
+        """필드 표에 따라 .env 값을 위젯에 반영
+
+        입력란은 값이 없으면 기본값으로 채우고, 콤보박스는 값이 있을 때만 변경합니다.
+        """
+        for attr, env_key, default in fields:
+            widget = getattr(self, attr)
+            if isinstance(widget, QComboBox):
+                if env_key in env_vars:
+                    widget.setCurrentText(env_vars[env_key])
+            else:
+                widget.setText(env_vars.get(env_key, default))
+
+    def _env_field_lines(self, fields) -> list[str]:
+        """필드 표에 따라 위젯 값을 .env 줄로 변환
+
+        콤보박스 값은 항상 저장하고, 입력란은 비어 있으면 기본값을 쓰되 그래도 비면 생략합니다.
+        """
+        lines = []
+        for attr, env_key, default in fields:
+            widget = getattr(self, attr)
+            if isinstance(widget, QComboBox):
+                lines.append(f"{env_key}={widget.currentText()}")
+            else:
+                value = widget.text() or default
+                if value:
+                    lines.append(f"{env_key}={value}")
+        return lines
 
     def _load_mcp_settings(self):
         """MCP 설정 로드"""
@@ -787,24 +1131,16 @@ class SettingsDialog(QDialog):
 
             # 검색 엔진 프로바이더
             provider = mcp_config.web_search.options.get("provider", "duckduckgo")
-            provider_map = {
-                "duckduckgo": "DuckDuckGo (무료)",
-                "google": "Google",
-                "bing": "Bing"
-            }
-            self.search_provider_combo.setCurrentText(provider_map.get(provider, "DuckDuckGo (무료)"))
+            search_label = _SEARCH_PROVIDER_TO_UI.get(provider, "DuckDuckGo (무료)")
+            self.search_provider_combo.setCurrentText(search_label)
 
             # Image Generation MCP
             self.image_mcp_check.setChecked(mcp_config.image_generation.enabled)
 
             # 이미지 생성기 프로바이더
             img_provider = mcp_config.image_generation.options.get("provider", "dalle3")
-            img_provider_map = {
-                "dalle3": "DALL-E 3",
-                "stable_diffusion": "Stable Diffusion",
-                "midjourney": "Midjourney API"
-            }
-            self.image_gen_provider_combo.setCurrentText(img_provider_map.get(img_provider, "DALL-E 3"))
+            img_label = _IMAGE_GEN_PROVIDER_TO_UI.get(img_provider, "DALL-E 3")
+            self.image_gen_provider_combo.setCurrentText(img_label)
 
             # 고급 설정
             self.mcp_auto_connect_check.setChecked(mcp_config.auto_connect)
@@ -817,61 +1153,39 @@ class SettingsDialog(QDialog):
 
     def _save_settings(self):
         """설정 저장"""
+        # 아직 생성되지 않은 그룹은 기본값으로 저장되도록 모두 생성
+        for provider in self._PROVIDER_GROUP_BUILDERS:
+            self._ensure_provider_group(provider)
+        self._ensure_tab("_create_image_tab")
+
         env_lines = []
 
         # LLM 설정
         provider = self.provider_combo.currentText()
-        provider_map = {"OpenAI": "openai", "Google": "google", "Anthropic": "anthropic", "Ollama": "ollama"}
-        env_lines.append(f"LLM_PROVIDER={provider_map.get(provider, 'openai')}")
-        env_lines.append("")
-
-        # OpenAI
-        env_lines.append("# OpenAI")
-        if self.openai_api_key.text():
-            env_lines.append(f"OPENAI_API_KEY={self.openai_api_key.text()}")
-        env_lines.append(f"OPENAI_MODEL={self.openai_model.currentText()}")
-        env_lines.append("")
-
-        # Google
-        env_lines.append("# Google Gemini")
-        if self.google_api_key.text():
-            env_lines.append(f"GOOGLE_API_KEY={self.google_api_key.text()}")
-        env_lines.append(f"GOOGLE_MODEL={self.google_model.currentText()}")
+        env_lines.append(f"LLM_PROVIDER={_UI_TO_LLM_PROVIDER.get(provider, 'openai')}")
         env_lines.append("")
 
-        # Anthropic
-        env_lines.append("# Anthropic Claude")
-        if self.anthropic_api_key.text():
-            env_lines.append(f"ANTHROPIC_API_KEY={self.anthropic_api_key.text()}")
-        env_lines.append(f"ANTHROPIC_MODEL={self.anthropic_model.currentText()}")
-        env_lines.append("")
-
-        # Ollama
-        env_lines.append("# Ollama")
-        env_lines.append(f"OLLAMA_URL={self.ollama_url.text() or 'http://localhost:11434'}")
-        env_lines.append(f"OLLAMA_MODEL={self.ollama_model.currentText()}")
-        env_lines.append("")
+        for _, comment, fields in _LLM_ENV_SECTIONS:
+            env_lines.append(comment)
+            env_lines.extend(self._env_field_lines(fields))
+            env_lines.append("")
 
         # 이미지 프로바이더
         env_lines.append("# Image Provider")
         image_provider = self.image_provider_combo.currentText()
-        image_map = {"DALL-E (OpenAI)": "dall-e-3", "Pexels": "pexels", "Pixabay": "pixabay", "비활성화": "disabled"}
-        env_lines.append(f"IMAGE_PROVIDER={image_map.get(image_provider, 'dall-e-3')}")
-        if self.pexels_api_key.text():
-            env_lines.append(f"PEXELS_API_KEY={self.pexels_api_key.text()}")
-        if self.pixabay_api_key.text():
-            env_lines.append(f"PIXABAY_API_KEY={self.pixabay_api_key.text()}")
+        env_lines.append(f"IMAGE_PROVIDER={_UI_TO_IMAGE_PROVIDER.get(image_provider, 'dall-e-3')}")
+        env_lines.extend(self._env_field_lines(_IMAGE_ENV_FIELDS))
 
         try:
-            with open(".env", "w", encoding="utf-8") as f:
-                f.write("\n".join(env_lines))
+            _write_env_file(Path(".env"), "\n".join(env_lines))
 
             # 설정 다시 로드
             from src.config import reload_settings
             reload_settings()
 
-            # MCP 설정 저장
-            self._save_mcp_settings()
+            # MCP 설정 저장 (탭을 열지 않았으면 변경 사항 없음)
+            if self._is_tab_built("_create_mcp_tab"):
+                self._save_mcp_settings()
 
             QMessageBox.information(self, "저장 완료", "설정이 저장되었습니다.")
             self.accept()
@@ -888,12 +1202,7 @@ class SettingsDialog(QDialog):
             )
 
             # Web Search MCP
-            provider_map = {
-                "DuckDuckGo (무료)": "duckduckgo",
-                "Google": "google",
-                "Bing": "bing"
-            }
-            search_provider = provider_map.get(
+            search_provider = _UI_TO_SEARCH_PROVIDER.get(
                 self.search_provider_combo.currentText(),
                 "duckduckgo"
             )
@@ -905,17 +1214,12 @@ class SettingsDialog(QDialog):
             self._mcp_manager.update_service(
                 "web_search",
                 enabled=self.search_mcp_check.isChecked(),
-                api_key=self.search_api_key_input.text() if self.search_api_key_input.text() else None,
+                api_key=self.search_api_key_input.text() or None,
                 options=web_search_options
             )
 
             # Image Generation MCP
-            img_provider_map = {
-                "DALL-E 3": "dalle3",
-                "Stable Diffusion": "stable_diffusion",
-                "Midjourney API": "midjourney"
-            }
-            img_provider = img_provider_map.get(
+            img_provider = _UI_TO_IMAGE_GEN_PROVIDER.get(
                 self.image_gen_provider_combo.currentText(),
                 "dalle3"
             )
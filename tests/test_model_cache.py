@@ -0,0 +1,58 @@
+"""모델 목록 디스크 캐시 테스트"""
+
+import pytest
+
+from src.services import model_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """테스트마다 임시 디렉토리의 새 캐시 DB 사용"""
+    monkeypatch.setattr(model_cache, "get_cache_dir", lambda: tmp_path)
+    monkeypatch.setattr(model_cache, "_db_path", None)
+    return tmp_path
+
+
+def test_put_then_get_returns_models():
+    model_cache.put_models("openai", "sk-test", ["gpt-4o", "gpt-4o-mini"])
+
+    assert model_cache.get_models("openai", "sk-test") == ["gpt-4o", "gpt-4o-mini"]
+
+
+def test_empty_model_list_round_trips():
+    model_cache.put_models("openai", "sk-test", [])
+
+    assert model_cache.get_models("openai", "sk-test") == []
+
+
+def test_other_key_or_provider_misses():
+    model_cache.put_models("openai", "sk-test", ["gpt-4o"])
+
+    assert model_cache.get_models("openai", "sk-other") is None
+    assert model_cache.get_models("anthropic", "sk-test") is None
+
+
+def test_put_replaces_previous_entry():
+    model_cache.put_models("anthropic", "key", ["claude-a"])
+    model_cache.put_models("anthropic", "key", ["claude-b"])
+
+    assert model_cache.get_models("anthropic", "key") == ["claude-b"]
+
+
+def test_entry_expires_after_ttl(monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(model_cache.time, "time", lambda: now)
+    model_cache.put_models("openai", "sk-test", ["gpt-4o"])
+
+    monkeypatch.setattr(model_cache.time, "time", lambda: now + model_cache.MODEL_CACHE_TTL - 1)
+    assert model_cache.get_models("openai", "sk-test") == ["gpt-4o"]
+
+    monkeypatch.setattr(model_cache.time, "time", lambda: now + model_cache.MODEL_CACHE_TTL)
+    assert model_cache.get_models("openai", "sk-test") is None
+
+
+def test_api_key_is_not_written_to_disk(cache_dir):
+    model_cache.put_models("openai", "sk-secret-value", ["gpt-4o"])
+
+    db_bytes = b"".join(p.read_bytes() for p in cache_dir.iterdir() if p.is_file())
+    assert b"sk-secret-value" not in db_bytes
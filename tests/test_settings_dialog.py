@@ -0,0 +1,80 @@
+"""설정 다이얼로그 테스트"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+settings_dialog = pytest.importorskip("src.ui.dialogs.settings_dialog")
+
+
+def test_read_env_file_picks_up_external_changes(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("LLM_PROVIDER=openai\n", encoding="utf-8")
+    assert settings_dialog._read_env_file(env_path) == {"LLM_PROVIDER": "openai"}
+
+    env_path.write_text("LLM_PROVIDER=anthropic\n", encoding="utf-8")
+    # 파일 시스템의 시각 해상도와 무관하게 수정 시각이 바뀌도록 설정
+    st = env_path.stat()
+    os.utime(env_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert settings_dialog._read_env_file(env_path) == {"LLM_PROVIDER": "anthropic"}
+
+
+def test_read_missing_env_file_returns_none(tmp_path):
+    assert settings_dialog._read_env_file(tmp_path / ".env") is None
+
+
+def test_write_env_file_round_trip(tmp_path):
+    env_path = tmp_path / ".env"
+    content = "# 주석\nOPENAI_API_KEY=sk-test\nLLM_PROVIDER = openai\n"
+
+    settings_dialog._write_env_file(env_path, content)
+
+    assert env_path.read_text(encoding="utf-8") == content
+    assert settings_dialog._read_env_file(env_path) == {
+        "OPENAI_API_KEY": "sk-test",
+        "LLM_PROVIDER": "openai",
+    }
+    assert [p.name for p in tmp_path.iterdir()] == [".env"]
+
+
+def test_write_env_file_replaces_previously_read_values(tmp_path):
+    env_path = tmp_path / ".env"
+    settings_dialog._write_env_file(env_path, "LLM_PROVIDER=openai\n")
+    assert settings_dialog._read_env_file(env_path) == {"LLM_PROVIDER": "openai"}
+
+    settings_dialog._write_env_file(env_path, "LLM_PROVIDER=anthropic\n")
+
+    assert settings_dialog._read_env_file(env_path) == {"LLM_PROVIDER": "anthropic"}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX 권한 전용")
+def test_write_env_file_keeps_file_mode(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("OPENAI_API_KEY=old\n", encoding="utf-8")
+    env_path.chmod(0o600)
+
+    settings_dialog._write_env_file(env_path, "OPENAI_API_KEY=new\n")
+
+    assert env_path.stat().st_mode & 0o777 == 0o600
+    assert settings_dialog._read_env_file(env_path) == {"OPENAI_API_KEY": "new"}
+
+
+def test_set_combo_items_replaces_previous_items(qtbot):
+    from PySide6.QtWidgets import QComboBox
+
+    combo = QComboBox()
+    qtbot.addWidget(combo)
+    combo.addItems(["old-a", "old-b"])
+    combo.setCurrentIndex(1)
+
+    settings_dialog._set_combo_items(combo, ["gpt-4o", "gpt-4o-mini"])
+    assert [combo.itemText(i) for i in range(combo.count())] == ["gpt-4o", "gpt-4o-mini"]
+    assert combo.currentText() == "gpt-4o"
+
+    settings_dialog._set_combo_items(combo, ["claude-a"])
+    assert [combo.itemText(i) for i in range(combo.count())] == ["claude-a"]
+
+    settings_dialog._set_combo_items(combo, [])
+    assert combo.count() == 0
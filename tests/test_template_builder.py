@@ -0,0 +1,89 @@
+"""TemplateBuilder 테스트"""
+
+from src.templates.template_builder import TemplateBuilder
+
+
+def _builder(template_id: str = "sample") -> TemplateBuilder:
+    return TemplateBuilder(
+        id=template_id,
+        name="Sample",
+        name_ko="샘플",
+        category="business",
+    )
+
+
+def test_default_typography_and_spacing_are_not_shared():
+    first = _builder().build()["design"]
+    first["typography"]["sizes"]["title"] = 1
+    first["typography"]["weights"]["body"] = 1
+    first["spacing"]["margin"] = 1
+
+    second = _builder("other").build()["design"]
+    assert second["typography"]["sizes"]["title"] == 54
+    assert second["typography"]["weights"]["body"] == 400
+    assert second["spacing"]["margin"] == 60
+
+
+def test_build_reflects_changes_made_after_a_previous_build():
+    builder = _builder()
+    builder.build()
+
+    builder.name = "Renamed"
+    builder.add_tag("startup")
+    builder.set_spacing(margin=10)
+
+    result = builder.build()
+    assert result["metadata"]["name"] == "Renamed"
+    assert result["tags"] == ["startup"]
+    assert result["design"]["spacing"]["margin"] == 10
+
+
+def test_build_returns_a_new_dict_each_call():
+    builder = _builder()
+    first = builder.build()
+    first["metadata"]["name"] = "Changed"
+
+    assert builder.build()["metadata"]["name"] == "Sample"
+
+
+def test_set_typography_uses_given_sizes_as_is():
+    builder = _builder().set_typography(heading_font="Noto Sans KR", sizes={"title": 60})
+
+    typography = builder.build()["design"]["typography"]
+    assert typography["heading_font"] == "Noto Sans KR"
+    assert typography["sizes"] == {"title": 60}
+    assert typography["weights"] == {"title": 700, "heading": 600, "body": 400}
+
+
+def test_structure_is_serialized_as_plain_dicts():
+    builder = _builder().add_slide_types([
+        ("title", "title_centered", True, "표지"),
+        ("agenda", "bullet_points", False, None),
+    ])
+
+    structure = builder.build()["structure"]
+    assert structure["recommended_slides"] == [
+        {"type": "title", "layout": "title_centered", "required": True, "name": "표지"},
+        {"type": "agenda", "layout": "bullet_points", "required": False, "name": "agenda"},
+    ]
+    assert structure["optimal_slides"] == 2
+
+
+def test_index_entry_thumbnail_follows_id_and_category():
+    builder = _builder()
+    assert builder.to_index_entry()["thumbnail"] == "business/sample/thumbnail.png"
+
+    builder.id = "renamed"
+    builder.category = "education"
+
+    assert builder.to_index_entry()["thumbnail"] == "education/renamed/thumbnail.png"
+
+
+def test_default_assets_are_not_shared():
+    first = _builder().build()
+    first["assets"]["thumbnail"] = "changed.png"
+
+    assert _builder("other").build()["assets"] == {
+        "master_pptx": "master.pptx",
+        "thumbnail": "thumbnail.png",
+    }
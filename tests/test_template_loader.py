@@ -0,0 +1,83 @@
+"""TemplateLoader 테스트"""
+
+import json
+
+import pytest
+
+from src.templates import template_loader
+from src.templates.template_loader import TemplateLoader
+
+
+def _write_template_json(templates_dir, template_id, category="business", **extra):
+    template_dir = templates_dir / category / template_id
+    template_dir.mkdir(parents=True, exist_ok=True)
+    (template_dir / "template.json").write_text(
+        json.dumps({"id": template_id, **extra}), encoding="utf-8"
+    )
+
+
+def _write_templates(templates_dir, ids, category="business"):
+    """index.json과 템플릿별 template.json 생성"""
+    entries = [
+        {
+            "id": template_id,
+            "name": template_id.title(),
+            "name_ko": template_id,
+            "category": category,
+            "description": f"{template_id} 템플릿",
+            "tags": [template_id],
+        }
+        for template_id in ids
+    ]
+    for template_id in ids:
+        _write_template_json(templates_dir, template_id, category)
+    (templates_dir / "index.json").write_text(
+        json.dumps({"templates": entries, "categories": []}), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    _write_templates(tmp_path, ["alpha", "beta", "gamma"])
+    return tmp_path
+
+
+def test_search_templates_matches_name_and_tags(templates_dir):
+    loader = TemplateLoader(str(templates_dir))
+
+    assert [t.id for t in loader.search_templates("ALPHA")] == ["alpha"]
+    assert [t.id for t in loader.search_templates("alpha")] == ["alpha"]
+    assert loader.search_templates("delta") == []
+
+
+def test_search_after_reload_index_uses_the_new_index(templates_dir):
+    loader = TemplateLoader(str(templates_dir))
+    assert [t.id for t in loader.search_templates("alpha")] == ["alpha"]
+    assert loader.search_templates("delta") == []
+
+    _write_templates(templates_dir, ["beta", "delta"])
+    loader.reload_index()
+
+    assert loader.search_templates("alpha") == []
+    assert [t.id for t in loader.search_templates("delta")] == ["delta"]
+    assert sorted(t.id for t in loader.list_templates()) == ["beta", "delta"]
+
+
+def test_get_template_rereads_only_evicted_templates(templates_dir, monkeypatch):
+    monkeypatch.setattr(template_loader, "_MAX_CACHED_TEMPLATES", 2)
+    loader = TemplateLoader(str(templates_dir))
+    loader.get_template("alpha")
+    loader.get_template("beta")
+    loader.get_template("alpha")
+    # 가장 오래 사용하지 않은 beta가 밀려남
+    loader.get_template("gamma")
+
+    _write_template_json(templates_dir, "alpha", version="2")
+    _write_template_json(templates_dir, "beta", version="2")
+
+    assert loader.get_template("alpha") == {"id": "alpha"}
+    assert loader.get_template("beta") == {"id": "beta", "version": "2"}
+
+
+def test_get_template_unknown_id_returns_none(templates_dir):
+    assert TemplateLoader(str(templates_dir)).get_template("missing") is None